@@ -9,7 +9,40 @@ SELENIUM_CONFIG = {
     "headless": os.getenv("HEADLESS", "true").lower() == "true",
     "implicit_wait": 10,
     "page_load_timeout": 30,
+    # "eager" returns from get() at DOMContentLoaded; extraction waits for its own selectors
+    "page_load_strategy": os.getenv("PAGE_LOAD_STRATEGY", "eager"),
+    "script_timeout": 30,
+    "stats_wait_timeout": 5,
+    "page_ready_timeout": 10,
+    "cookie_wait_timeout": 3,
+    "tab_wait_timeout": 5,
+    "pool_size": int(os.getenv("DRIVER_POOL_SIZE", "1")),
+    # Worker processes with one driver each (0 = use the in-process driver pool)
+    "process_workers": int(os.getenv("SCRAPE_PROCESSES", "0")),
+    # Processes that parse Match Info / Lineups HTML while the driver threads keep
+    # navigating (0 = parse in the driver thread)
+    "parse_workers": int(os.getenv("PARSE_PROCESSES", "0")),
+    # Attach every pooled driver to one already running Chrome (host:port of its
+    # --remote-debugging-port) instead of launching a browser per driver
+    "debugger_address": os.getenv("CHROME_DEBUGGER_ADDRESS", ""),
+    # Keep-alive connections each driver holds to chromedriver (Selenium's urllib3
+    # default keeps only one per host)
+    "command_pool_size": int(os.getenv("DRIVER_COMMAND_POOL_SIZE", "20")),
     "window_size": (1920, 1080),
+    # Emulated viewport height, tall enough that lazy-loaded sections render without scrolling
+    "viewport_height": 6000,
+    # Skip images, fonts, media and trackers - only the DOM text is scraped
+    "block_resources": os.getenv("BLOCK_RESOURCES", "true").lower() == "true",
+    # Stylesheets are opt-in: without CSS, hidden tab panels and lazy-loaded sections
+    # can lay out differently and break visibility-based waits and innerText
+    "block_stylesheets": os.getenv("BLOCK_STYLESHEETS", "false").lower() == "true",
+    "blocked_url_patterns": [
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.avif",
+        "*.mp4", "*.webm", "*.m3u8",
+        "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+        "*facebook.net*", "*hotjar*", "*scorecardresearch*",
+    ],
 }
 
 # Scraping
@@ -17,17 +50,35 @@ SCRAPING_CONFIG = {
     "base_url": "https://www.premierleague.com",
     "match_url_template": "https://www.premierleague.com/match/{match_id}",
     "request_delay": float(os.getenv("REQUEST_DELAY", "2")),
+    "retry_attempts": int(os.getenv("RETRY_ATTEMPTS", "3")),
+    "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    # How matchweeks are listed: "browser" (results page filter) or
+    # "ids" (the season's sequential match IDs, keeping drivers free for match pages)
+    "listing_source": os.getenv("LISTING_SOURCE", "browser"),
 }
 
 # CSS Selectors
 CSS_SELECTORS = {
     "stats_tab": "[data-tab-index='3'], a[href*='stats']",
     "cookie_accept": "#onetrust-accept-btn-handler",
+    "match_ready": ".match-header__team-name, .mc-summary__team-name, .team-name",
+    "results_ready": 'a[href*="/match/"]',
+    "filter_options": "label.input-button__label",
+    "match_info_ready": ".match-details__entry",
+    "lineups_ready": ".lineups-player",
 }
 
 # Stats categories
 STATS_CATEGORIES = ["Top Stats", "Attack", "Possession", "Defence", "Physical", "Discipline"]
 
+# Match payload cache
+CACHE_CONFIG = {
+    "enabled": os.getenv("MATCH_CACHE", "true").lower() == "true",
+    "cache_dir": os.getenv("MATCH_CACHE_DIR", ".cache/matches"),
+    "live_ttl": int(os.getenv("MATCH_CACHE_LIVE_TTL", "3600")),  # seconds, entries not marked full time
+    "html_snapshot_dir": os.getenv("HTML_SNAPSHOT_DIR", ""),  # empty disables page snapshots
+}
+
 # AWS S3
 S3_CONFIG = {
     "bucket_name": os.getenv("AWS_S3_BUCKET", ""),
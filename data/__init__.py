@@ -1,3 +1,4 @@
 from .processor import S3DataStore
+from .parquet_writer import MatchParquetWriter
 
-__all__ = ["S3DataStore"]
+__all__ = ["S3DataStore", "MatchParquetWriter"]
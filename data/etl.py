@@ -1,6 +1,7 @@
 
 """ETL Pipeline for processing Premier League data through Bronze, Silver, and Gold layers."""
 import os
+import re
 import json
 import shutil
 import tempfile
@@ -17,6 +18,9 @@ except ImportError:
     logger.warning("PySpark not found. Some ETL features may be disabled.")
     HAS_SPARK = False
 
+# "12 (45%)" style stat values: absolute value and percentage
+STAT_PERCENT_PATTERN = re.compile(r"([\d\.]+)\s*\(([\d\.]+)%\)")
+
 
 class ETLPipeline:
     def __init__(self, bucket_name: str = None, prefix: str = None):
@@ -201,7 +205,8 @@ class ETLPipeline:
                         if obj['Key'].endswith('.csv'):
                             df = self.store.read_csv(obj['Key'])
                             if df is not None: gold_dfs.append(df)
-             except: pass
+             except Exception as e:
+                logger.warning(f"Could not list gold analytics for {season}: {e}")
 
         if gold_dfs:
             gold_master = pd.concat(gold_dfs, ignore_index=True)
@@ -248,7 +253,7 @@ class ETLPipeline:
             os = float(opp_score) if opp_score is not None else 0
             if ts > os: result = "W"
             elif ts < os: result = "L"
-        except: pass
+        except (TypeError, ValueError): pass
         
         record = {
             "match_id": cl_row.get("match_id"),
@@ -326,7 +331,7 @@ class ETLPipeline:
                 val = clean["match_info"].get(score_key)
                 if val is not None and not isinstance(val, int):
                     try: clean["match_info"][score_key] = int(val)
-                    except: clean["match_info"][score_key] = 0
+                    except (TypeError, ValueError): clean["match_info"][score_key] = 0
 
         raw_stats = {}
         if "statistics" in clean and isinstance(clean["statistics"], dict):
@@ -362,19 +367,18 @@ class ETLPipeline:
         val_str = str(value).strip()
         
         if "(" in val_str and ")" in val_str:
-            import re
-            match = re.search(r"([\d\.]+)\s*\(([\d\.]+)%\)", val_str)
+            match = STAT_PERCENT_PATTERN.search(val_str)
             if match:
                 return {"value": float(match.group(1)), "percent": float(match.group(2))}
         
         if val_str.lower().endswith("km"):
             try: return float(val_str.lower().replace("km", ""))
-            except: pass
+            except ValueError: pass
             
         if val_str.endswith("%"):
             try: return float(val_str.rstrip("%"))
-            except: pass
+            except ValueError: pass
             
         if val_str.isdigit(): return int(val_str)
         try: return float(val_str)
-        except: return val_str
+        except ValueError: return val_str
@@ -0,0 +1,141 @@
+"""Columnar (Parquet) output for scraped matches, one file per season matchweek."""
+import os
+import json
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+from loguru import logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    logger.warning("pyarrow not found. Parquet output is disabled.")
+    HAS_PYARROW = False
+
+
+# Scalar match fields get typed columns; nested sections are kept as JSON strings
+# so the schema stays fixed (Spark: from_json, pandas: json.loads).
+NESTED_FIELDS = ["statistics", "detailed_statistics", "events", "lineups"]
+
+if HAS_PYARROW:
+    MATCH_SCHEMA = pa.schema([
+        ("match_id", pa.int64()),
+        ("season", pa.string()),
+        ("matchweek", pa.int16()),
+        ("home_team", pa.string()),
+        ("away_team", pa.string()),
+        ("home_score", pa.int16()),
+        ("away_score", pa.int16()),
+        ("date", pa.string()),
+        ("kickoff", pa.string()),
+        ("stadium", pa.string()),
+        ("attendance", pa.string()),
+        ("referee", pa.string()),
+        ("url", pa.string()),
+        ("scraped_at", pa.string()),
+    ] + [(field, pa.string()) for field in NESTED_FIELDS])
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def match_to_row(match: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a scraped match dict into a row matching MATCH_SCHEMA."""
+    info = match.get("match_info") or {}
+    row = {
+        "match_id": _to_int(match.get("match_id")),
+        "season": match.get("season"),
+        "matchweek": _to_int(match.get("matchweek")),
+        "home_team": info.get("home_team"),
+        "away_team": info.get("away_team"),
+        "home_score": _to_int(info.get("home_score")),
+        "away_score": _to_int(info.get("away_score")),
+        "date": info.get("date"),
+        "kickoff": info.get("kickoff"),
+        "stadium": info.get("stadium") or info.get("venue"),
+        "attendance": info.get("attendance"),
+        "referee": info.get("referee"),
+        "url": match.get("url"),
+        "scraped_at": match.get("scraped_at"),
+    }
+    for field in NESTED_FIELDS:
+        value = match.get(field)
+        row[field] = json.dumps(value, ensure_ascii=False) if value is not None else None
+    return row
+
+
+class MatchParquetWriter:
+    """
+    Buffer scraped matches and write them to Parquet in record batches.
+
+    Files are laid out as `<output_dir>/<season>/matchweek_<NN>-<run_id>.parquet`;
+    each matchweek file stays open until close() so rows are appended batch by batch.
+    Every writer uses its own run_id, so a resumed scrape adds a part file next to
+    the earlier ones instead of overwriting them; read a season directory as a
+    dataset (pyarrow.dataset / pandas.read_parquet) to get all of its parts.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        batch_size: int = 64,
+        compression: str = "zstd",
+        run_id: Optional[str] = None
+    ):
+        if not HAS_PYARROW:
+            raise ImportError("pyarrow is required for Parquet output")
+
+        self.output_dir = output_dir
+        self.batch_size = batch_size
+        self.compression = compression
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self._buffers: Dict[tuple, List[Dict[str, Any]]] = {}
+        self._writers: Dict[tuple, "pq.ParquetWriter"] = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def _path(self, season: Optional[str], matchweek: Optional[int]) -> str:
+        season_dir = os.path.join(self.output_dir, (season or "unknown").replace("/", "-"))
+        os.makedirs(season_dir, exist_ok=True)
+        return os.path.join(season_dir, f"matchweek_{matchweek or 0:02d}-{self.run_id}.parquet")
+
+    def _flush(self, key: tuple) -> None:
+        rows = self._buffers.pop(key, None)
+        if not rows:
+            return
+
+        writer = self._writers.get(key)
+        if writer is None:
+            writer = pq.ParquetWriter(self._path(*key), MATCH_SCHEMA, compression=self.compression)
+            self._writers[key] = writer
+
+        writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=MATCH_SCHEMA))
+        logger.debug(f"Wrote {len(rows)} matches to {self._path(*key)}")
+
+    def write(self, match: Dict[str, Any]) -> None:
+        """Queue one match; a batch is written once batch_size matches of a matchweek are buffered."""
+        row = match_to_row(match)
+        key = (row["season"], row["matchweek"])
+        self._buffers.setdefault(key, []).append(row)
+        if len(self._buffers[key]) >= self.batch_size:
+            self._flush(key)
+
+    def close(self) -> None:
+        """Write remaining rows and finalize all Parquet files."""
+        for key in list(self._buffers):
+            self._flush(key)
+        for writer in self._writers.values():
+            writer.close()
+        if self._writers:
+            logger.info(f"Closed {len(self._writers)} Parquet files in {self.output_dir}")
+        self._writers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
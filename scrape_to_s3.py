@@ -13,6 +13,8 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from config.settings import S3_CONFIG
 from scraper.season_scraper import SeasonScraper
+from scraper.driver_pool import WebDriverPool
+from scraper.rate_limiter import RateLimiter
 from data.processor import S3DataStore
 from data.db import MatchDB
 
@@ -30,8 +32,9 @@ _setup_logging()
 
 class SingleThreadScraper:
     """Helper class to run a scraper in a single thread/process context."""
-    def __init__(self, headless=True):
-        self.scraper = SeasonScraper(headless=headless)
+    def __init__(self, headless=True, pool: Optional[WebDriverPool] = None):
+        # With a shared pool the browsers outlive this worker and are reused by the next one
+        self.scraper = SeasonScraper(headless=headless, pool=pool)
         self.db = MatchDB()
         self.s3_store = S3DataStore()
         
@@ -49,8 +52,11 @@ class SingleThreadScraper:
         match_ids = self.scraper._calculate_match_ids_for_matchweek(matchweek, season)
         
         logger.info(f"MW{matchweek}: Starting processing ({len(match_ids)} matches)")
+        # Only the time left since the previous page load is slept, not a full delay,
+        # and cached matches are not paced at all
+        self.scraper.match_limiter = RateLimiter(1 / delay) if delay > 0 else None
         
-        for i, match_id in enumerate(match_ids):
+        for match_id in match_ids:
             # CHECK DB
             current_status = self.db.get_match_status(match_id)
             if current_status == "PLAYED":
@@ -72,7 +78,7 @@ class SingleThreadScraper:
                     try:
                         hs = int(hs) if hs is not None else None
                         as_ = int(as_) if as_ is not None else None
-                    except: pass
+                    except (TypeError, ValueError): pass
                         
                     if isinstance(hs, int) and isinstance(as_, int):
                         status = "PLAYED"
@@ -86,9 +92,6 @@ class SingleThreadScraper:
                     })
             except Exception as e:
                 logger.error(f"MW{matchweek} | Error scraping {match_id}: {e}")
-            
-            if i < len(match_ids) - 1:
-                time.sleep(delay)
 
         # Upload Aggregate for this MW
         if all_matches:
@@ -99,10 +102,11 @@ class SingleThreadScraper:
         return results
 
 
-def run_matchweek_task(matchweek: int, season: str, delay: float, formats: List[str], headless: bool):
+def run_matchweek_task(matchweek: int, season: str, delay: float, formats: List[str], headless: bool,
+                       pool: Optional[WebDriverPool] = None):
     """Worker function to be run in a separate thread."""
     try:
-        with SingleThreadScraper(headless=headless) as worker:
+        with SingleThreadScraper(headless=headless, pool=pool) as worker:
             return worker.process_matchweek(matchweek, season, delay, formats)
     except Exception as e:
         logger.critical(f"Critical error in thread for MW{matchweek}: {e}")
@@ -173,12 +177,14 @@ def main():
         
         start_time = time.time()
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        # One browser per thread, started once and reused for every matchweek
+        with WebDriverPool(workers, headless=not args.no_headless) as pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
             # Map each matchweek to the worker function
             future_to_mw = {
                 executor.submit(
                     run_matchweek_task, 
-                    mw, args.season, args.delay, formats, not args.no_headless
+                    mw, args.season, args.delay, formats, not args.no_headless, pool
                 ): mw for mw in matchweeks
             }
             
@@ -1,3 +1,4 @@
+from .driver_pool import WebDriverPool
 from .season_scraper import SeasonScraper
 
-__all__ = ["SeasonScraper"]
+__all__ = ["SeasonScraper", "WebDriverPool"]
@@ -0,0 +1,242 @@
+"""
+Pool of persistent Chrome WebDriver sessions.
+Drivers are started once and handed out to scraping threads, so the browser
+cold start is paid per driver instead of per match.
+"""
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Set
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import WebDriverException
+from loguru import logger
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import SELENIUM_CONFIG, SCRAPING_CONFIG
+
+
+class WebDriverPool:
+    """
+    Fixed-size pool of started Chrome drivers.
+
+    Usage:
+        with pool.checkout() as driver:
+            driver.get(url)
+    """
+
+    def __init__(self, size: int = None, headless: bool = True, init_scripts: Optional[List[str]] = None):
+        """
+        Args:
+            size: Number of drivers (defaults to SELENIUM_CONFIG["pool_size"])
+            headless: Run Chrome without a window
+            init_scripts: JavaScript sources evaluated in every new document, before
+                the page's own scripts (installed over CDP on each driver)
+        """
+        self.size = max(1, size or SELENIUM_CONFIG["pool_size"])
+        self.headless = headless
+        self.init_scripts = list(init_scripts or [])
+        self.drivers: List[webdriver.Chrome] = []
+        self._idle: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        self._lock = threading.Lock()
+        # Drivers whose browser profile already went through the cookie banner
+        self.consent_handled: Set[webdriver.Chrome] = set()
+
+    @property
+    def started(self) -> bool:
+        return bool(self.drivers)
+
+    def start(self) -> None:
+        """Start all drivers (no-op if already started)."""
+        with self._lock:
+            if self.drivers:
+                return
+            for _ in range(self.size):
+                driver = self.create_driver()
+                self.drivers.append(driver)
+                self._idle.put(driver)
+        logger.info(f"Driver pool ready ({self.size} drivers)")
+
+    def stop(self) -> None:
+        """Quit all drivers."""
+        with self._lock:
+            if not self.drivers:
+                return
+            for driver in self.drivers:
+                try:
+                    self.quit_driver(driver)
+                except Exception as e:
+                    logger.debug(f"Error quitting driver: {e}")
+            self.drivers = []
+            self._idle = queue.Queue()
+            self.consent_handled.clear()
+        logger.info("WebDriver session closed")
+
+    def add_init_scripts(self, scripts: List[str]) -> None:
+        """
+        Install scripts in every new document of the running drivers and of drivers started later.
+
+        Scripts the pool already has are skipped, so scrapers sharing a pool install them once.
+        """
+        with self._lock:
+            new_scripts = [source for source in scripts if source not in self.init_scripts]
+            self.init_scripts.extend(new_scripts)
+            for driver in self.drivers:
+                self._install_init_scripts(driver, new_scripts)
+
+    def acquire(self) -> webdriver.Chrome:
+        """Take an idle driver, blocking until one is returned."""
+        return self._idle.get()
+
+    def release(self, driver: webdriver.Chrome) -> None:
+        """
+        Return a driver taken with acquire().
+
+        Cookies and the browser cache are deliberately kept: every driver only visits
+        premierleague.com, the consent cookie spares the next match the cookie banner
+        (see consent_handled), and the cached site bundles are what makes warm page
+        loads fast.
+        """
+        self._idle.put(driver)
+
+    @contextmanager
+    def checkout(self) -> Iterator[webdriver.Chrome]:
+        """Hold a driver for the duration of the block."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def replace(self, old_driver: webdriver.Chrome) -> webdriver.Chrome:
+        """
+        Quit a checked-out driver and start a fresh one in its slot.
+
+        Returns:
+            The new driver; release() it instead of the old one
+        """
+        try:
+            self.quit_driver(old_driver)
+        except Exception as e:
+            logger.debug(f"Error quitting crashed driver: {e}")
+
+        self.consent_handled.discard(old_driver)
+        new_driver = self.create_driver()
+        with self._lock:
+            self.drivers[self.drivers.index(old_driver)] = new_driver
+        return new_driver
+
+    def create_driver(self) -> webdriver.Chrome:
+        """Configure and return a new Chrome WebDriver."""
+        if SELENIUM_CONFIG["debugger_address"]:
+            return self._configure_driver(self._attach_driver())
+
+        chrome_options = Options()
+        chrome_options.page_load_strategy = SELENIUM_CONFIG["page_load_strategy"]
+
+        if self.headless:
+            chrome_options.add_argument("--headless=new")
+
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_argument("--disable-popup-blocking")
+        chrome_options.add_argument(f"--window-size={SELENIUM_CONFIG['window_size'][0]},{SELENIUM_CONFIG['window_size'][1]}")
+        chrome_options.add_argument(f"--user-agent={SCRAPING_CONFIG['user_agent']}")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+
+        if SELENIUM_CONFIG["block_resources"]:
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            prefs = {"profile.managed_default_content_settings.images": 2}
+            if SELENIUM_CONFIG["block_stylesheets"]:
+                prefs["profile.managed_default_content_settings.stylesheets"] = 2
+            chrome_options.add_experimental_option("prefs", prefs)
+
+        return self._configure_driver(webdriver.Chrome(options=chrome_options))
+
+    @staticmethod
+    def _attach_driver() -> webdriver.Chrome:
+        """
+        Open a session on the shared Chrome at debugger_address, in a tab of its own.
+
+        Launch flags (headless, window size, image blocking) are whatever the shared
+        browser was started with; its HTTP and disk caches are shared by all drivers.
+        """
+        chrome_options = Options()
+        chrome_options.page_load_strategy = SELENIUM_CONFIG["page_load_strategy"]
+        chrome_options.add_experimental_option("debuggerAddress", SELENIUM_CONFIG["debugger_address"])
+        driver = webdriver.Chrome(options=chrome_options)
+        # Sessions attached to the same browser would otherwise all drive the active tab
+        driver.switch_to.new_window("tab")
+        return driver
+
+    def _configure_driver(self, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Apply network blocking, the viewport override, init scripts and timeouts to a new session."""
+        if SELENIUM_CONFIG["block_resources"]:
+            # Recent Chrome ignores the stylesheet pref, so also block by URL over CDP
+            patterns = list(SELENIUM_CONFIG["blocked_url_patterns"])
+            if SELENIUM_CONFIG["block_stylesheets"]:
+                patterns.append("*.css")
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            except WebDriverException as e:
+                logger.warning(f"Could not set blocked URLs: {e}")
+
+        # A viewport taller than any match page renders lazy-loaded sections in
+        # the first layout, without scrolling
+        try:
+            driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": SELENIUM_CONFIG["window_size"][0],
+                "height": SELENIUM_CONFIG["viewport_height"],
+                "deviceScaleFactor": 1,
+                "mobile": False,
+            })
+        except WebDriverException as e:
+            logger.warning(f"Could not override viewport size: {e}")
+
+        # Selenium 4.16 keeps one pooled connection to chromedriver, so overlapping
+        # commands open throwaway connections ("connection pool is full"). PoolManager
+        # applies connection_pool_kw to the pools it creates, so clear() makes the next
+        # command use a larger pool while keeping Selenium's timeout and proxy setup.
+        connection_manager = getattr(driver.command_executor, "_conn", None)
+        if connection_manager is not None and hasattr(connection_manager, "connection_pool_kw"):
+            connection_manager.connection_pool_kw["maxsize"] = SELENIUM_CONFIG["command_pool_size"]
+            connection_manager.clear()
+
+        self._install_init_scripts(driver, self.init_scripts)
+
+        driver.implicitly_wait(SELENIUM_CONFIG["implicit_wait"])
+        driver.set_page_load_timeout(SELENIUM_CONFIG["page_load_timeout"])
+        driver.set_script_timeout(SELENIUM_CONFIG["script_timeout"])
+
+        logger.info("Chrome WebDriver initialized")
+        return driver
+
+    @staticmethod
+    def _install_init_scripts(driver: webdriver.Chrome, scripts: List[str]) -> None:
+        """Evaluate scripts in the driver's future documents, before the page's own scripts."""
+        for source in scripts:
+            try:
+                driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+            except WebDriverException as e:
+                logger.warning(f"Could not install init script: {e}")
+
+    @staticmethod
+    def quit_driver(driver: webdriver.Chrome) -> None:
+        """End a WebDriver session; in shared-browser mode only its own tab is closed."""
+        if SELENIUM_CONFIG["debugger_address"]:
+            driver.close()
+        driver.quit()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
@@ -0,0 +1,62 @@
+"""
+Compressed page_source snapshots of match pages.
+Lets extraction be re-run later without network access (SeasonScraper.reextract_match).
+"""
+import glob
+import gzip
+from typing import List, Optional
+
+from loguru import logger
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import CACHE_CONFIG
+
+
+# Tabs captured per match, in scrape order
+SNAPSHOT_TABS = ("stats", "match_info", "lineups")
+
+
+class HtmlSnapshotStore:
+    """gzip-compressed HTML files named <match_id>.<tab>.html.gz."""
+
+    def __init__(self, snapshot_dir: str = None, compresslevel: int = 6):
+        self.snapshot_dir = snapshot_dir or CACHE_CONFIG["html_snapshot_dir"]
+        self.compresslevel = compresslevel
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+
+    def _path(self, match_id: int, tab: str) -> str:
+        return os.path.join(self.snapshot_dir, f"{match_id}.{tab}.html.gz")
+
+    def save(self, match_id: int, tab: str, html: str) -> None:
+        """Write a snapshot; a temp file is renamed into place so readers never see partial data."""
+        path = self._path(match_id, tab)
+        tmp_path = f"{path}.tmp"
+        try:
+            with gzip.open(tmp_path, "wb", compresslevel=self.compresslevel) as f:
+                f.write(html.encode("utf-8"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not snapshot {tab} for match {match_id}: {e}")
+
+    def load(self, match_id: int, tab: str) -> Optional[str]:
+        """Return the snapshot HTML, or None if it was never captured."""
+        try:
+            with gzip.open(self._path(match_id, tab), "rb") as f:
+                return f.read().decode("utf-8")
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError) as e:
+            logger.warning(f"Ignoring unreadable {tab} snapshot for match {match_id}: {e}")
+            return None
+
+    def match_ids(self) -> List[int]:
+        """Match IDs with at least one snapshot, sorted."""
+        ids = set()
+        for path in glob.glob(os.path.join(self.snapshot_dir, "*.html.gz")):
+            prefix = os.path.basename(path).split(".", 1)[0]
+            if prefix.isdigit():
+                ids.add(int(prefix))
+        return sorted(ids)
+
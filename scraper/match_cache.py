@@ -0,0 +1,110 @@
+"""
+Disk-backed cache for scraped match payloads.
+Matches the page marks as full time are cached forever; every other entry expires after a TTL.
+"""
+import functools
+import hashlib
+import json
+import re
+import time
+from typing import Dict, Optional, Any
+
+from loguru import logger
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import CACHE_CONFIG
+
+# Status text the match page shows once the final whistle has gone
+FULL_TIME_PATTERN = re.compile(r"^\s*(FT|full[\s-]*time)\b", re.IGNORECASE)
+
+
+class MatchCache:
+    """
+    Content-addressed JSON-on-disk store keyed by (season, match_id).
+
+    The matchweek is left out of the key: it is derived from the match, and callers
+    that pass it and callers that let the scraper detect it must share entries.
+    """
+
+    def __init__(self, cache_dir: str = None, live_ttl: int = None):
+        self.cache_dir = cache_dir or CACHE_CONFIG["cache_dir"]
+        self.live_ttl = live_ttl if live_ttl is not None else CACHE_CONFIG["live_ttl"]
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _key(season: Optional[str], match_id: int) -> str:
+        return hashlib.sha1(f"{season}:{match_id}".encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    @staticmethod
+    def _write_json(path: str, data: Dict[str, Any]) -> None:
+        """Write to a temp file first so readers never see partial JSON."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def is_finished(data: Dict[str, Any]) -> bool:
+        """
+        A match is finished only when the page's status reads full time.
+
+        Scores alone are not enough: a live match already has them.
+        """
+        status = data.get("match_info", {}).get("status")
+        return bool(status) and FULL_TIME_PATTERN.match(status) is not None
+
+    def get(self, season: Optional[str], match_id: int) -> Optional[Dict[str, Any]]:
+        """Return the cached payload, or None on a miss or an expired live match."""
+        path = self._path(self._key(season, match_id))
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for match {match_id}: {e}")
+            return None
+
+        if not self.is_finished(data) and time.time() - os.path.getmtime(path) > self.live_ttl:
+            return None
+        return data
+
+    def set(self, season: Optional[str], match_id: int, data: Dict[str, Any]) -> None:
+        """Store a payload atomically."""
+        try:
+            self._write_json(self._path(self._key(season, match_id)), data)
+        except OSError as e:
+            logger.warning(f"Could not cache match {match_id}: {e}")
+
+
+def _with_matchweek(data: Dict[str, Any], matchweek: Optional[int]) -> Dict[str, Any]:
+    """Fill in the caller's matchweek when the cached scrape could not detect it."""
+    if matchweek is not None and data.get("matchweek") is None:
+        data["matchweek"] = matchweek
+    return data
+
+
+def cached_match(method):
+    """Serve a scraper's match-scraping method from its MatchCache when possible."""
+    @functools.wraps(method)
+    def wrapper(self, match_id: int, matchweek: int = None, season: str = None):
+        if self.cache is None:
+            return method(self, match_id, matchweek, season)
+
+        cached = self.cache.get(season, match_id)
+        if cached is not None:
+            logger.info(f"Cache hit for match {match_id}")
+            return _with_matchweek(cached, matchweek)
+
+        data = method(self, match_id, matchweek, season)
+        if data:
+            self.cache.set(season, match_id, data)
+        return data
+
+    return wrapper
@@ -0,0 +1,188 @@
+"""
+HTML parsers for Premier League match pages.
+Work on a page_source snapshot so extraction needs a single WebDriver round trip.
+"""
+import re
+from typing import Dict, Any, List, Optional, Tuple
+
+from selectolax.parser import HTMLParser, Node
+
+
+REFEREE_PATTERN = re.compile(r"Referee\s+([A-Za-z\s]+?)\s+(?:Assistant|Fourth|VAR|$)", re.IGNORECASE)
+FORMATION_PATTERN = re.compile(r"Formation\s+(\d+-\d+-\d+)", re.IGNORECASE)
+MANAGER_PATTERN = re.compile(r"Manager\s+([A-Za-z\s]+?)(?=\d|Formation|$)", re.IGNORECASE)
+
+LINEUPS_HOME_SELECTOR = ".lineups-team-formation--home"
+LINEUPS_AWAY_SELECTOR = ".lineups-team-formation--away"
+LINEUPS_PLAYER_SELECTOR = ".lineups-player"
+PLAYER_NAME_SELECTORS = ("p.lineups-player__info", "p", ".lineups-player__name")
+PLAYER_NUMBER_SELECTORS = (".lineups-player__shirt-number", ".lineups-player__number")
+SQUAD_LIST_SELECTOR = ".squad-list"
+SQUAD_ITEM_SELECTOR = ".squad-list__item"
+
+# Scoreboard events (goals and cards)
+HT_SCORE_SELECTOR = ".match-status__half-time-score"
+EVENT_SCORER_SELECTOR = ".scoreboard-event__scorer"
+EVENT_ASSIST_SELECTOR = ".scoreboard-event__assist"
+EVENT_LIST_SELECTORS = {
+    "home_goals": 'ul[data-testid="homeTeamGoals"]',
+    "away_goals": 'ul[data-testid="awayTeamGoals"]',
+    "home_yellow_cards": 'ul[data-testid="homeTeamYellowCards"]',
+    "away_yellow_cards": 'ul[data-testid="awayTeamYellowCards"]',
+    "home_red_cards": 'ul[data-testid="homeTeamRedCards"]',
+    "away_red_cards": 'ul[data-testid="awayTeamRedCards"]',
+}
+
+
+def page_text(tree: HTMLParser) -> str:
+    """Visible-ish body text: script/style contents are dropped, blocks separated by newlines."""
+    tree.strip_tags(["script", "style", "noscript"])
+    return tree.body.text(separator="\n") if tree.body else ""
+
+
+def node_text(node: Node) -> str:
+    """Element text with whitespace collapsed, close to what WebElement.text returns."""
+    return " ".join(node.text(separator=" ").split())
+
+
+def parse_match_info(html: str) -> Dict[str, Any]:
+    """Extract match info from the Match Info tab (kickoff, stadium, attendance, referee)."""
+    result = {
+        "kickoff": None,
+        "stadium": None,
+        "attendance": None,
+        "referee": None
+    }
+
+    tree = HTMLParser(html)
+
+    # Find match-details entries
+    for entry in tree.css(".match-details__entry"):
+        entry_text = entry.text(separator="\n")
+        text = entry_text.lower()
+        value = ""
+        span = entry.css_first("span")
+        if span is not None:
+            value = span.text(strip=True)
+        else:
+            # Fallback if span not found
+            parts = [part for part in entry_text.split("\n") if part.strip()]
+            if len(parts) > 1:
+                value = parts[-1].strip()
+
+        if "kick-off" in text or "kickoff" in text:
+            result["kickoff"] = value
+        if "stadium" in text:
+            result["stadium"] = value
+        if "attendance" in text:
+            result["attendance"] = value
+
+    # Find referee from page text using regex as backup if not in entries
+    if not result["referee"]:
+        ref_match = REFEREE_PATTERN.search(page_text(tree))
+        if ref_match:
+            result["referee"] = ref_match.group(1).strip()
+
+    return result
+
+
+def _first_text(node: Node, selectors: Tuple[str, ...]) -> Optional[str]:
+    """Text of the first descendant matching any of the selectors, tried in order."""
+    for selector in selectors:
+        match = node.css_first(selector)
+        if match is not None:
+            return node_text(match)
+    return None
+
+
+def _lineup_side(player: Node, containers: Dict[int, str]) -> Optional[str]:
+    """Side of the nearest enclosing container in containers (mem_id -> side), else None."""
+    node = player.parent
+    while node is not None and node.tag != "-undef":
+        side = containers.get(node.mem_id)
+        if side is not None:
+            return side
+        node = node.parent
+    return None
+
+
+def _parse_players(tree: HTMLParser) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Starting XIs by side, from one pass over all lineup players.
+
+    If no named player was found in the home/away containers (sometimes
+    structure differs), the first 11 players on the page are taken as home
+    and the next 11 as away.
+    """
+    players = {"home": [], "away": []}
+    all_players = []
+    # Only the first container per side counts: pages that render the lineup twice
+    # (e.g. pitch and list views) would otherwise list every player twice
+    containers = {}
+    for side, selector in (("home", LINEUPS_HOME_SELECTOR), ("away", LINEUPS_AWAY_SELECTOR)):
+        container = tree.css_first(selector)
+        if container is not None:
+            containers[container.mem_id] = side
+
+    for player in tree.css(LINEUPS_PLAYER_SELECTOR):
+        all_players.append(player)
+        side = _lineup_side(player, containers) if containers else None
+        if side is None:
+            continue
+        name = _first_text(player, PLAYER_NAME_SELECTORS)
+        if name:
+            number = _first_text(player, PLAYER_NUMBER_SELECTORS)
+            players[side].append({"name": name, "number": number})
+
+    if not players["home"] and not players["away"] and len(all_players) >= 22:
+        fallback = []
+        for player in all_players:
+            lines = [line.strip() for line in player.text(separator="\n").split("\n") if line.strip()]
+            if lines:
+                fallback.append({"name": lines[0], "number": None})
+        if len(fallback) >= 22:
+            players["home"] = fallback[:11]
+            players["away"] = fallback[11:22]
+
+    return players
+
+
+def empty_lineups() -> Dict[str, Any]:
+    """Lineups result with no data, as returned when the Lineups tab cannot be read."""
+    return {
+        "home": {"formation": None, "manager": None, "starting_xi": [], "substitutes": []},
+        "away": {"formation": None, "manager": None, "starting_xi": [], "substitutes": []}
+    }
+
+
+def parse_lineups(html: str) -> Dict[str, Any]:
+    """Extract lineups from the Lineups tab (formations, managers, starting XI, subs)."""
+    result = empty_lineups()
+
+    tree = HTMLParser(html)
+
+    # Starting XI
+    players = _parse_players(tree)
+    result["home"]["starting_xi"] = players["home"]
+    result["away"]["starting_xi"] = players["away"]
+
+    # Substitutes
+    for team, squad_list in zip(("home", "away"), tree.css(SQUAD_LIST_SELECTOR)):
+        result[team]["substitutes"] = [
+            {"name": node_text(item)} for item in squad_list.css(SQUAD_ITEM_SELECTOR)
+        ]
+
+    # Formations and managers from the page text, in separate scans: a manager
+    # match can run into the next "Formation" line, which one alternation would skip
+    text = page_text(tree)
+    formations = FORMATION_PATTERN.findall(text)
+    managers = MANAGER_PATTERN.findall(text)
+    if len(formations) >= 2:
+        result["home"]["formation"] = formations[0]
+        result["away"]["formation"] = formations[1]
+
+    if len(managers) >= 2:
+        result["home"]["manager"] = managers[0].strip()
+        result["away"]["manager"] = managers[1].strip()
+
+    return result
@@ -0,0 +1,46 @@
+"""Token-bucket rate limiting for scraper requests."""
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe blocking token bucket, shared by the scraper's worker threads.
+
+    Unlike a fixed sleep after each request, time already spent on the request
+    counts towards the interval, so a slow page is not followed by a full pause.
+
+    Usage:
+        with limiter:
+            driver.get(url)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self) -> None:
+        """Block until a token is available, then take it."""
+        with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
@@ -2,28 +2,620 @@
 Premier League Season Scraper
 Scrapes all matches from an entire season with matchweek information
 """
+import asyncio
 import time
 import json
-import re
-from typing import Dict, List, Optional, Any, Tuple
+import multiprocessing
+import random
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.util import Finalize
+from typing import Dict, Iterator, List, Optional, Any, Set, Tuple
 from datetime import datetime
+from urllib.parse import urlparse
 
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     WebDriverException,
 )
 from loguru import logger
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config.settings import SELENIUM_CONFIG, SCRAPING_CONFIG
+from config.settings import SELENIUM_CONFIG, SCRAPING_CONFIG, CSS_SELECTORS, CACHE_CONFIG
+from scraper.rate_limiter import RateLimiter
+from scraper.match_cache import MatchCache, cached_match
+from scraper.driver_pool import WebDriverPool
+from scraper.html_snapshots import HtmlSnapshotStore
+from scraper.page_parser import (
+    parse_match_info,
+    parse_lineups,
+    empty_lineups,
+    SQUAD_LIST_SELECTOR,
+    HT_SCORE_SELECTOR,
+    EVENT_SCORER_SELECTOR,
+    EVENT_ASSIST_SELECTOR,
+    EVENT_LIST_SELECTORS,
+)
+
+
+# Selectors and patterns used on every match page, built once at import time
+_SEL_COOKIE_ACCEPT = CSS_SELECTORS["cookie_accept"]
+# XPath form of CSS_SELECTORS["filter_options"]; the filter script appends the text predicate
+_XPATH_FILTER_LABEL = "//label[contains(concat(' ', normalize-space(@class), ' '), ' input-button__label ')]"
+
+# Resolves with the first element matching arguments[0] as soon as the DOM
+# reports it (MutationObserver), or null after arguments[1] ms - one round trip
+# instead of a WebDriverWait polling loop
+_WAIT_FOR_SELECTOR_JS = """
+    const done = arguments[arguments.length - 1];
+    const selector = arguments[0];
+    const timeoutMs = arguments[1];
+    const found = document.querySelector(selector);
+    if (found) return done(found);
+    const observer = new MutationObserver(() => {
+        const el = document.querySelector(selector);
+        if (el) {
+            observer.disconnect();
+            done(el);
+        }
+    });
+    observer.observe(document.documentElement, { childList: true, subtree: true });
+    setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+# Defines findClickTarget(selector, text): the first element matching selector whose
+# trimmed text equals text. Candidates are indexed by text in a page-scoped cache, so
+# later lookups on the same page (Stats, Match Info, Lineups) skip the querySelectorAll
+# scan; the cache is dropped with the page on navigation, and detached nodes trigger a rescan.
+_FIND_CLICK_TARGET_JS = """
+    const findClickTarget = (selector, text) => {
+        const cache = window.__clickTargets || (window.__clickTargets = new Map());
+        let byText = cache.get(selector);
+        let el = byText && byText.get(text);
+        if (!el || !el.isConnected) {
+            byText = new Map();
+            for (const candidate of document.querySelectorAll(selector)) {
+                const label = candidate.textContent.trim();
+                if (!byText.has(label)) byText.set(label, candidate);
+            }
+            cache.set(selector, byText);
+            el = byText.get(text);
+        }
+        return el || null;
+    };
+"""
+
+# Clicks a tab by its text, waits for each of arguments[2]'s selectors to appear and
+# resolves with {clicked, ready, html} - one round trip instead of click, waits and
+# page_source. html is null when the tab was not found.
+_SHOW_TAB_JS = _FIND_CLICK_TARGET_JS + """
+    const done = arguments[arguments.length - 1];
+    const [selector, text, readySelectors, timeoutMs] = arguments;
+    const waitFor = (sel, ms) => new Promise(resolve => {
+        if (document.querySelector(sel)) return resolve(true);
+        const observer = new MutationObserver(() => {
+            if (document.querySelector(sel)) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(document.documentElement, { childList: true, subtree: true });
+        setTimeout(() => { observer.disconnect(); resolve(false); }, ms);
+    });
+    
+    (async () => {
+        const el = findClickTarget(selector, text);
+        if (!el) return { clicked: false, ready: false, html: null };
+        el.scrollIntoView({ block: 'center' });
+        el.click();
+        let ready = true;
+        for (const sel of readySelectors) {
+            ready = (await waitFor(sel, timeoutMs)) && ready;
+        }
+        return { clicked: true, ready, html: document.documentElement.outerHTML };
+    })().then(done).catch(() => done(null));
+"""
+
+# Applies the results-page filter (season, all months, matchweek, Save) and waits for
+# the filtered list to replace the current one. Resolves with the steps that succeeded.
+_APPLY_RESULTS_FILTER_JS = """
+    const done = arguments[arguments.length - 1];
+    const [seasonLabel, mwLabel, optionSel, labelXPath, resultsSel, timeoutMs] = arguments;
+    
+    const nextFrame = () => new Promise(resolve => requestAnimationFrame(() => resolve()));
+    const waitFor = (check, ms) => new Promise(resolve => {
+        if (check()) return resolve(true);
+        const observer = new MutationObserver(() => {
+            if (check()) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(document.documentElement, { childList: true, subtree: true });
+        setTimeout(() => { observer.disconnect(); resolve(false); }, ms);
+    });
+    
+    // Labels are located with one exact XPath query instead of scanning every option
+    const findLabel = (predicate) => document.evaluate(
+        `${labelXPath}[${predicate}]`, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    const findLabels = (predicate) => {
+        const snapshot = document.evaluate(
+            `${labelXPath}[${predicate}]`, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        return Array.from({ length: snapshot.snapshotLength }, (_, i) => snapshot.snapshotItem(i));
+    };
+    const isMwLabel = `normalize-space()='${mwLabel}'`;
+    const isChecked = (label) => {
+        const input = label.control || label.querySelector('input');
+        return !!(input && input.checked);
+    };
+    const click = (el) => {
+        if (!el) return false;
+        el.scrollIntoView({ block: 'center' });
+        el.click();
+        return true;
+    };
+    
+    (async () => {
+        const steps = {};
+        steps.filters = click(document.querySelector('button[aria-label="All Filters"]'));
+        if (!steps.filters) return steps;
+        await waitFor(() => document.querySelector(optionSel), timeoutMs);
+        
+        // Options are toggles: clicking one that is already selected (when re-filtering
+        // a results page) would deselect it
+        const seasonOption = findLabel(`contains(normalize-space(), '${seasonLabel}')`);
+        steps.season = !!seasonOption && (isChecked(seasonOption) || click(seasonOption));
+        // Filter panel re-renders after a season change
+        await nextFrame();
+        const monthOption = findLabel("normalize-space()='All'");
+        steps.month = !!monthOption && (isChecked(monthOption) || click(monthOption));
+        if (!await waitFor(() => findLabel(isMwLabel), timeoutMs)) {
+            // Options further down the panel may only render once scrolled into view
+            const options = document.querySelectorAll(optionSel);
+            if (options.length) options[options.length - 1].scrollIntoView({ block: 'end' });
+            await waitFor(() => findLabel(isMwLabel), timeoutMs);
+        }
+        
+        // When re-filtering a live results page, drop the matchweek selected last time
+        for (const label of findLabels(`starts-with(normalize-space(), 'MW') and not(${isMwLabel})`)) {
+            if (isChecked(label)) click(label);
+        }
+        const mwOption = findLabel(isMwLabel);
+        steps.matchweek = !!mwOption && (isChecked(mwOption) || click(mwOption));
+        await nextFrame();
+        
+        // The unfiltered results are already on the page, so wait for them to be replaced
+        const oldCard = document.querySelector(resultsSel);
+        const saveBtn = Array.from(document.querySelectorAll('button'))
+            .find(btn => btn.textContent.trim() === 'Save');
+        steps.save = click(saveBtn);
+        if (steps.save) {
+            steps.refreshed = oldCard ? await waitFor(() => !oldCard.isConnected, timeoutMs) : true;
+            await waitFor(() => document.querySelector(resultsSel), timeoutMs);
+        }
+        return steps;
+    })().then(done).catch(e => done({ error: String(e) }));
+"""
+
+# Match cards on the (filtered) results page -> [{match_id, home_team, away_team, scores, date}],
+# unique by match_id, sorted by match_id and capped at arguments[0] entries
+_EXTRACT_MATCHES_JS = """
+    const limit = arguments[0];
+    
+    // Selectors and patterns are built once per call, not once per card
+    const CARD_SEL = 'a.match-card, a[href*="/match/"]';
+    // Team selectors in priority order: the first one matching two nodes wins
+    // ([class*="team-name"] also matches wrappers, so it must not compete in one query)
+    const TEAM_SELS = ['.mc-summary__team-name', '[class*="team-name"]', '.team-name'];
+    const SCORE_SEL = '.mc-summary__score, [class*="score"]';
+    const MATCH_ID_RE = /match\\/(\\d+)/;
+    const SCORE_RE = /(\\d+)\\s*[-–]\\s*(\\d+)/;
+
+    const extractMatches = () => {
+        // Keyed by match ID: overlapping cards are skipped in O(1)
+        const matches = new Map();
+
+        // Find all match cards
+        const matchCards = document.querySelectorAll(CARD_SEL);
+
+        matchCards.forEach(card => {
+            const href = card.getAttribute('href') || '';
+            const matchIdMatch = href.match(MATCH_ID_RE);
+
+            if (matchIdMatch) {
+                const matchId = parseInt(matchIdMatch[1]);
+                if (matches.has(matchId)) return;
+
+                // Get team names
+                let homeTeam = null, awayTeam = null;
+                for (const sel of TEAM_SELS) {
+                    const teams = card.querySelectorAll(sel);
+                    if (teams.length >= 2) {
+                        homeTeam = teams[0].textContent.trim();
+                        awayTeam = teams[1].textContent.trim();
+                        break;
+                    }
+                }
+
+                // Get score
+                const scoreEl = card.querySelector(SCORE_SEL);
+                let homeScore = null, awayScore = null;
+                if (scoreEl) {
+                    const scoreText = scoreEl.textContent.trim();
+                    const scoreMatch = scoreText.match(SCORE_RE);
+                    if (scoreMatch) {
+                        homeScore = parseInt(scoreMatch[1]);
+                        awayScore = parseInt(scoreMatch[2]);
+                    }
+                }
+
+                // Get date
+                const dateHeader = card.closest('.match-list-item')?.querySelector('.match-list-item__date');
+                const date = dateHeader?.textContent.trim() || null;
+
+                matches.set(matchId, {
+                    match_id: matchId,
+                    home_team: homeTeam,
+                    away_team: awayTeam,
+                    home_score: homeScore,
+                    away_score: awayScore,
+                    date: date
+                });
+            }
+        });
+
+        return Array.from(matches.values())
+            .sort((a, b) => a.match_id - b.match_id)
+            .slice(0, limit);
+    };
+
+    return extractMatches();
+"""
+
+# Match page: matchweek and scoreboard events, then the Stats tab (clicked and
+# awaited in the same call). Arguments: stats tab selector, stats wait (ms),
+# event list selectors, HT score / scorer / assist selectors.
+_EXTRACT_ALL_JS = """
+    const done = arguments[arguments.length - 1];
+    const statsTabSelector = arguments[0];
+    const statsWaitMs = arguments[1];
+    const eventListSels = arguments[2];
+    const htScoreSel = arguments[3];
+    const scorerSel = arguments[4];
+    const assistSel = arguments[5];
+
+    // Selectors and patterns shared by the extractors below
+    // Tried in priority order, like the card selectors in _EXTRACT_MATCHES_JS
+    const TEAM_SELS = ['.match-header__team-name', '.team-name', '[class*="team-name"]', '.mc-summary__team-name'];
+    const SCORE_SEL = '.match-header__score, .score, [class*="score"]';
+    // Match state shown next to the score ("FT", a live minute, a kick-off time)
+    const STATUS_SELS = ['.match-status__status', '.mc-summary__full-time', '.match-header__status', '.matchStatus'];
+    const STATS_TABLE_ROW_SEL = '.match-stats__table-row';
+    const STAT_ROW_SEL = '.match-stats__table-row, [class*="stats-row"], [class*="stat-row"]';
+    const SCORE_RE = /(\\d+)\\s*[-–]\\s*(\\d+)/;
+    const LEADING_NUMBER_RE = /^([\\d.]+)/;
+    const HT_SCORE_RE = /HT\\s*(\\d+)\\s*[-–]\\s*(\\d+)/i;
+    const MATCHWEEK_SEL = '.match-header__gameweek, [class*="matchweek"], [class*="gameweek"], .mc-summary__info';
+    const MATCHWEEK_RE = /(?:Matchweek|MW|Gameweek|GW)\\s*(\\d+)/i;
+    const PAGE_MATCHWEEK_RE = /Matchweek\\s+(\\d+)/i;
+
+    // Matchweek from the match header, falling back to the page text
+    const getMatchweek = () => {
+        for (const el of document.querySelectorAll(MATCHWEEK_SEL)) {
+            const match = el.textContent.match(MATCHWEEK_RE);
+            if (match) return parseInt(match[1]);
+        }
+        const match = document.body.innerText.match(PAGE_MATCHWEEK_RE);
+        return match ? parseInt(match[1]) : null;
+    };
+
+    // Goals and cards from the scoreboard (main page, before any tab is clicked)
+    const getEvents = () => {
+        const result = { half_time_score: null };
+
+        const htEl = document.querySelector(htScoreSel);
+        const htMatch = htEl && htEl.innerText.trim().match(HT_SCORE_RE);
+        if (htMatch) result.half_time_score = `${htMatch[1]}-${htMatch[2]}`;
+
+        // One query finds every event list present; most matches have no cards,
+        // so the lists that are missing cost nothing
+        const entries = Object.entries(eventListSels);
+        for (const [key] of entries) result[key] = [];
+        const lists = document.querySelectorAll(entries.map(([, selector]) => selector).join(', '));
+        const seen = new Set();
+        for (const ul of lists) {
+            // First list per selector in document order, as querySelector would pick
+            const entry = entries.find(([, selector]) => ul.matches(selector));
+            if (!entry || seen.has(entry[0])) continue;
+            seen.add(entry[0]);
+            const [key, selector] = entry;
+            const isGoals = selector.includes('Goals');
+            for (const li of ul.querySelectorAll('li')) {
+                const text = li.innerText.trim();
+                if (!text) continue;
+                if (!isGoals) {
+                    // Cards just append text
+                    result[key].push(text);
+                    continue;
+                }
+                // Use the full text as scorer if the parts are not marked up
+                const scorerEl = li.querySelector(scorerSel);
+                const assistEl = scorerEl && li.querySelector(assistSel);
+                result[key].push({
+                    scorer: scorerEl ? scorerEl.innerText.trim() : text,
+                    assist: assistEl ? assistEl.innerText.trim() : null
+                });
+            }
+        }
+        return result;
+    };
+
+    // Alternatives are tried in priority order: one combined query would return
+    // whichever comes first in the document, e.g. a site-nav link to /stats.
+    // No selector means the page already shows the Stats tab (a saved snapshot)
+    const clickStatsTab = () => {
+        if (!statsTabSelector) return false;
+        const tab = statsTabSelector.split(',')
+            .reduce((found, sel) => found || document.querySelector(sel.trim()), null)
+            || Array.from(document.querySelectorAll('a, button'))
+                .find(el => el.textContent.includes('Stats'));
+        if (tab) tab.click();
+        return !!tab;
+    };
+
+    // Resolve as soon as a stats row is rendered, or after the timeout
+    const waitForStats = (timeoutMs) => new Promise(resolve => {
+        if (document.querySelector(STATS_TABLE_ROW_SEL)) return resolve(true);
+        const observer = new MutationObserver(() => {
+            if (document.querySelector(STATS_TABLE_ROW_SEL)) {
+                observer.disconnect();
+                resolve(true);
+            }
+        });
+        observer.observe(document.body, { childList: true, subtree: true });
+        setTimeout(() => { observer.disconnect(); resolve(false); }, timeoutMs);
+    });
+
+
+    const extractAll = () => {
+        // Extract team names and score
+        const getMatchInfo = () => {
+            let homeTeam = null, awayTeam = null;
+            for (const sel of TEAM_SELS) {
+                const teams = document.querySelectorAll(sel);
+                if (teams.length >= 2) {
+                    homeTeam = teams[0].textContent.trim();
+                    awayTeam = teams[1].textContent.trim();
+                    break;
+                }
+            }
+
+            // Get score
+            let homeScore = null, awayScore = null;
+            const scoreEl = document.querySelector(SCORE_SEL);
+            if (scoreEl) {
+                const text = scoreEl.textContent.trim();
+                const match = text.match(SCORE_RE);
+                if (match) {
+                    homeScore = parseInt(match[1]);
+                    awayScore = parseInt(match[2]);
+                }
+            }
+
+            // Get date
+            const dateEl = document.querySelector('.match-header__date, [class*="match-date"], time');
+            const date = dateEl?.textContent.trim() || null;
+
+            // Get venue
+            const venueEl = document.querySelector('.match-header__venue, [class*="venue"]');
+            const venue = venueEl?.textContent.trim() || null;
+
+            // Get referee
+            const refEl = document.querySelector('[class*="referee"]');
+            const referee = refEl?.textContent.replace('Referee:', '').trim() || null;
+
+            // Get status, first non-empty alternative in priority order
+            let status = null;
+            for (const sel of STATUS_SELS) {
+                const text = document.querySelector(sel)?.textContent.trim();
+                if (text) {
+                    status = text;
+                    break;
+                }
+            }
+
+            return {
+                home_team: homeTeam,
+                away_team: awayTeam,
+                home_score: homeScore,
+                away_score: awayScore,
+                date: date,
+                venue: venue,
+                referee: referee,
+                status: status
+            };
+        };
+
+        // Clean up values (keep the leading number, e.g. "5 (60%)" -> "5")
+        const parseValue = (val) => {
+            if (!val) return null;
+            const match = val.match(LEADING_NUMBER_RE);
+            return match ? match[1] : val;
+        };
+
+        // Extract all statistics (comprehensive)
+        const getStats = () => {
+            const stats = {};
+
+            // Find all stat rows
+            const rows = document.querySelectorAll(STAT_ROW_SEL);
+
+            rows.forEach(row => {
+                // Get stat name
+                const nameEl = row.querySelector('.match-stats__stat-name, [class*="stat-name"], [class*="name"]');
+                if (!nameEl) return;
+
+                const statName = nameEl.textContent.trim();
+                if (!statName) return;
+
+                // Get home value
+                const homeEl = row.querySelector('.match-stats__table-cell--home, [class*="home"][class*="value"], td:first-child');
+                const awayEl = row.querySelector('.match-stats__table-cell--away, [class*="away"][class*="value"], td:last-child');
+
+                // Handle different value formats
+                let homeValue = homeEl ? homeEl.textContent.trim() : null;
+                let awayValue = awayEl ? awayEl.textContent.trim() : null;
+
+                stats[statName] = {
+                    home: homeValue,
+                    away: awayValue,
+                    home_parsed: parseValue(homeValue),
+                    away_parsed: parseValue(awayValue)
+                };
+            });
+
+            return stats;
+        };
+
+        // Extract detailed stats by category
+        const getDetailedStats = () => {
+            const result = {
+                top_stats: {},
+                attack: {},
+                possession: {},
+                defence: {},
+                physical: {},
+                discipline: {}
+            };
+
+            const categoryMap = {
+                'top stats': 'top_stats',
+                'attack': 'attack',
+                'possession': 'possession',
+                'defence': 'defence',
+                'defense': 'defence',
+                'physical': 'physical',
+                'discipline': 'discipline'
+            };
+
+            // Extract all rows
+            const rows = document.querySelectorAll(STATS_TABLE_ROW_SEL);
+            rows.forEach(row => {
+                const cells = row.querySelectorAll('.match-stats__table-cell');
+                if (cells.length >= 3) {
+                    const home = cells[0].textContent.trim();
+                    const name = cells[1].textContent.trim();
+                    const away = cells[2].textContent.trim();
+
+                    if (name && !name.includes('undefined')) {
+                        const section = row.closest('[class*="section"]');
+                        let cat = 'top_stats';
+
+                        if (section) {
+                            const sectionText = section.textContent.toLowerCase();
+                            for (const [key, value] of Object.entries(categoryMap)) {
+                                if (sectionText.startsWith(key)) {
+                                    cat = value;
+                                    break;
+                                }
+                            }
+                        }
+
+                        result[cat][name] = {
+                            home: home,
+                            away: away
+                        };
+                    }
+                }
+            });
+
+            return result;
+        };
+
+        return {
+            match_info: getMatchInfo(),
+            statistics: getStats(),
+            detailed_statistics: getDetailedStats()
+        };
+    };
+
+    (async () => {
+        // The viewport override keeps every section on screen, so no scrolling is needed
+        const matchweek = getMatchweek();
+        const events = getEvents();
+
+        if (clickStatsTab()) {
+            await waitForStats(statsWaitMs);
+        }
+
+        done({ ...extractAll(), events, matchweek });
+    })().catch(() => done(null));
+"""
+
+# Replaces the current document with saved page HTML. DOMParser leaves the page's
+# own scripts inert, so the snapshot is not re-rendered or sent back to the network
+_LOAD_SNAPSHOT_JS = """
+    const doc = new DOMParser().parseFromString(arguments[0], 'text/html');
+    document.replaceChild(document.adoptNode(doc.documentElement), document.documentElement);
+"""
+
+# Async scripts run on every match page. They are installed into each new document
+# over CDP (see _INSTALL_PAGE_SCRIPTS_JS), so a call only sends their name and arguments
+# instead of the full source.
+_PAGE_SCRIPTS = {
+    "extract_all": _EXTRACT_ALL_JS,
+    "show_tab": _SHOW_TAB_JS,
+}
+_INSTALL_PAGE_SCRIPTS_JS = "window.__plScraper = {" + ",".join(
+    f"{name}: function () {{{source}}}" for name, source in _PAGE_SCRIPTS.items()
+) + "};"
+# Calls an installed script by name (arguments[0]); resolves with {__missing: true}
+# when the page has none, e.g. if installing it over CDP failed
+_CALL_PAGE_SCRIPT_JS = """
+    const [name, ...args] = arguments;
+    const fn = window.__plScraper && window.__plScraper[name];
+    if (!fn) return arguments[arguments.length - 1]({ __missing: true });
+    fn.apply(null, args);
+"""
+
+
+def _dumps_line(data: Dict[str, Any]) -> bytes:
+    """Serialize one record as a UTF-8 JSON line (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data) + b"\n"
+    return (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def _loads_line(line: bytes) -> Any:
+    return orjson.loads(line) if HAS_ORJSON else json.loads(line)
+
+
+def _build_season_match_ids(
+    seasons: Dict[str, Dict[str, int]],
+    matchweeks: int,
+    per_week: int
+) -> Dict[str, Tuple[Tuple[int, ...], ...]]:
+    """Map each season to its per-matchweek match ID tuples (index 0 is MW1)."""
+    return {
+        season: tuple(
+            tuple(range(config["start_match_id"] + mw * per_week, config["start_match_id"] + (mw + 1) * per_week))
+            for mw in range(matchweeks)
+        )
+        for season, config in seasons.items()
+    }
 
 
 class SeasonScraper:
@@ -56,95 +648,196 @@ class SeasonScraper:
     TOTAL_MATCHWEEKS = 38
     MATCHES_PER_WEEK = 10
     
-    def __init__(self, headless: bool = True):
-        """Initialize the season scraper."""
+    # Every matchweek's match IDs for every season, built once at import time
+    _SEASON_MATCH_IDS = _build_season_match_ids(SEASONS, TOTAL_MATCHWEEKS, MATCHES_PER_WEEK)
+    
+    def __init__(
+        self,
+        headless: bool = True,
+        pool_size: int = None,
+        processes: int = None,
+        resume_path: Optional[str] = None,
+        pool: Optional[WebDriverPool] = None,
+        parse_workers: int = None
+    ):
+        """
+        Initialize the season scraper.
+        
+        Args:
+            headless: Run Chrome without a window
+            pool_size: Number of persistent Chrome drivers used to scrape matches in parallel
+            processes: Number of worker processes, each with its own persistent driver.
+                When greater than 1 match extraction runs outside this process (no GIL
+                contention) and pool_size is ignored.
+            resume_path: Optional JSONL file from a previous run, only read: matches
+                already in it are skipped by scrape_match_with_matchweek and iter_matchweeks.
+                To also append new matches, pass output_path to iter_matchweeks.
+            pool: Driver pool shared with other scrapers. start() starts it if needed,
+                but stop() leaves it running for its owner to stop; pool_size is ignored.
+            parse_workers: Processes that parse tab HTML while the drivers navigate
+                (defaults to SELENIUM_CONFIG["parse_workers"]; 0 parses inline)
+        """
         self.headless = headless
-        self.driver = None
-        self.wait = None
+        self.pool_size = max(1, pool_size or SELENIUM_CONFIG["pool_size"])
+        self.processes = processes if processes is not None else SELENIUM_CONFIG["process_workers"]
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self.parse_workers = parse_workers if parse_workers is not None else SELENIUM_CONFIG["parse_workers"]
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._owns_pool = pool is None
+        # With worker processes the local driver is only needed for the listing fallback
+        self.pool = pool or WebDriverPool(1 if self.processes > 1 else self.pool_size, headless)
+        # Shared pools get the extraction scripts too (installed once per pool)
+        self.pool.add_init_scripts([_INSTALL_PAGE_SCRIPTS_JS])
+        self._local = threading.local()
+        self.cache = MatchCache() if CACHE_CONFIG["enabled"] else None
+        self.snapshots = HtmlSnapshotStore() if CACHE_CONFIG["html_snapshot_dir"] else None
+        self._done_ids: Set[int] = self._load_scraped_ids(resume_path) if resume_path else set()
+        # Paces match page loads; taken right before navigation, so cache hits and
+        # skipped matches are not delayed
+        self.match_limiter: Optional[RateLimiter] = None
         logger.info("Initializing Season Scraper")
     
-    def _setup_driver(self) -> None:
-        """Configure Chrome WebDriver."""
-        chrome_options = Options()
-        
-        if self.headless:
-            chrome_options.add_argument("--headless=new")
-        
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument(f"--window-size={SELENIUM_CONFIG['window_size'][0]},{SELENIUM_CONFIG['window_size'][1]}")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.implicitly_wait(SELENIUM_CONFIG["implicit_wait"])
-        self.driver.set_page_load_timeout(SELENIUM_CONFIG["page_load_timeout"])
-        self.wait = WebDriverWait(self.driver, SELENIUM_CONFIG["implicit_wait"])
+    @property
+    def driver(self) -> Optional[webdriver.Chrome]:
+        """
+        Driver checked out by the current thread.
+        Outside a checkout the first pooled driver is used, which is safe
+        as long as no pool workers are running.
+        """
+        driver = getattr(self._local, "driver", None)
+        if driver is None and self.pool.started:
+            return self.pool.drivers[0]
+        return driver
+    
+    @contextmanager
+    def _checkout_driver(self) -> Iterator[webdriver.Chrome]:
+        """Bind a pooled driver to the current thread for the duration of the block (re-entrant)."""
+        if getattr(self._local, "driver", None) is not None:
+            yield self._local.driver
+            return
         
-        logger.info("Chrome WebDriver initialized")
+        driver = self.pool.acquire()
+        self._local.driver = driver
+        try:
+            yield driver
+        finally:
+            # The driver may have been replaced after a crash
+            self.pool.release(self._local.driver)
+            self._local.driver = None
+    
+    def _restart_current_driver(self) -> None:
+        """Replace the current thread's driver with a fresh browser."""
+        self._local.driver = self.pool.replace(self._local.driver)
     
     def start(self) -> None:
-        """Start the WebDriver session."""
-        if self.driver is None:
-            self._setup_driver()
+        """Start the pool of WebDriver sessions (and the worker processes, if enabled)."""
+        self.pool.start()
+        
+        if self.processes > 1 and self._process_pool is None:
+            # spawn, not fork: a forked child would inherit chromedriver sockets and threads
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.headless,),
+            )
+            logger.info(f"Started {self.processes} scraper processes")
+        
+        # With worker processes nothing is parsed here (workers are started with parse_workers=0)
+        if self.parse_workers > 0 and self.processes <= 1 and self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"Started {self.parse_workers} HTML parser processes")
     
     def stop(self) -> None:
-        """Stop the WebDriver session."""
-        if self.driver:
-            self.driver.quit()
-            self.driver = None
-            logger.info("WebDriver session closed")
+        """Stop all WebDriver sessions and worker processes."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=True)
+            self._process_pool = None
+            logger.info("Scraper processes stopped")
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=True)
+            self._parse_pool = None
+        if self._owns_pool:
+            self.pool.stop()
     
-    def _handle_cookie_consent(self) -> None:
-        """Handle cookie consent popup."""
+    def _wait_for_selector(self, selector: str, timeout: float) -> Optional[Any]:
+        """
+        Wait for an element to appear, notified by the page instead of polling.
+        
+        Args:
+            selector: CSS selector
+            timeout: Maximum wait in seconds
+            
+        Returns:
+            The WebElement, or None if it did not appear in time
+        """
+        return self.driver.execute_async_script(_WAIT_FOR_SELECTOR_JS, selector, int(timeout * 1000))
+    
+    def _wait_ready(self, timeout: float) -> bool:
+        """
+        Wait for document.readyState to reach "complete".
+        
+        Returns:
+            False if the document was still loading after timeout seconds
+        """
         try:
-            cookie_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "#onetrust-accept-btn-handler"))
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState === 'complete'")
             )
-            cookie_button.click()
-            time.sleep(1)
+            return True
         except TimeoutException:
-            pass
+            return False
+    
+    def _handle_cookie_consent(self) -> None:
+        """
+        Handle cookie consent popup.
+        
+        The consent cookie persists for the browser's lifetime, so each warm driver
+        only waits for the banner on its first page; a restarted driver starts over.
+        """
+        driver = self.driver
+        if driver in self.pool.consent_handled:
+            return
+        
+        try:
+            cookie_button = self._wait_for_selector(_SEL_COOKIE_ACCEPT, SELENIUM_CONFIG["cookie_wait_timeout"])
+            if cookie_button is not None:
+                driver.execute_script("arguments[0].click();", cookie_button)
+            self.pool.consent_handled.add(driver)
         except Exception as e:
             logger.debug(f"Cookie consent: {e}")
     
-    def _calculate_match_ids_for_matchweek(self, matchweek: int, season: str = "2025/26") -> List[int]:
+    @staticmethod
+    def _calculate_match_ids_for_matchweek(matchweek: int, season: str = "2025/26") -> Tuple[int, ...]:
         """
-        Calculate match IDs for a specific matchweek based on start_match_id.
+        Get match IDs for a specific matchweek based on start_match_id.
         
         Each matchweek has 10 matches. Match IDs are sequential.
         MW1 starts at start_match_id, MW2 starts at start_match_id + 10, etc.
+        The IDs are looked up in the table precomputed for the whole season.
         
         Args:
             matchweek: Matchweek number (1-38)
             season: Season string
             
         Returns:
-            List of 10 match IDs for the matchweek
+            Tuple of 10 match IDs for the matchweek
         """
-        season_config = self.SEASONS.get(season)
-        if not season_config:
+        season_ids = SeasonScraper._SEASON_MATCH_IDS.get(season)
+        if not season_ids:
             logger.error(f"Unknown season: {season}")
-            return []
+            return ()
         
-        start_match_id = season_config["start_match_id"]
+        if not 1 <= matchweek <= len(season_ids):
+            logger.error(f"Invalid matchweek: {matchweek}")
+            return ()
         
-        # Calculate starting match ID for this matchweek
-        # MW1: start_match_id + 0
-        # MW2: start_match_id + 10
-        # MW3: start_match_id + 20
-        # etc.
-        mw_start_id = start_match_id + (matchweek - 1) * self.MATCHES_PER_WEEK
-        
-        match_ids = [mw_start_id + i for i in range(self.MATCHES_PER_WEEK)]
-        
-        logger.info(f"Calculated match IDs for MW{matchweek}: {match_ids[0]} to {match_ids[-1]}")
+        match_ids = season_ids[matchweek - 1]
+        logger.debug(f"Match IDs for MW{matchweek}: {match_ids[0]} to {match_ids[-1]}")
         return match_ids
-
     
     def get_matchweek_matches(self, matchweek: int, season: str = "2025/26") -> List[Dict[str, Any]]:
         """
@@ -168,164 +861,47 @@ class SeasonScraper:
         logger.info(f"Fetching Matchweek {matchweek} matches")
         
         try:
-            self.driver.get(url)
-            time.sleep(3)
-            self._handle_cookie_consent()
+            # Re-filter in place when this driver is still on the results page
+            # (filter widget live, cookies accepted); navigate only otherwise
+            if urlparse(self.driver.current_url).path.rstrip("/") != urlparse(url).path:
+                self.driver.get(url)
+                if self._wait_for_selector(CSS_SELECTORS["results_ready"], SELENIUM_CONFIG["page_ready_timeout"]) is None:
+                    self._wait_ready(SELENIUM_CONFIG["page_ready_timeout"])
+                self._handle_cookie_consent()
+            else:
+                logger.debug(f"Results page already loaded, re-filtering for MW{matchweek}")
             
-            # Click on All Filters to access all filter options
-            try:
-                all_filters_btn = self.driver.find_element(
-                    By.CSS_SELECTOR, 'button[aria-label="All Filters"]'
-                )
-                self.driver.execute_script("arguments[0].click();", all_filters_btn)
-                time.sleep(1)
-                
-                # First, select the correct season
-                season_id = season_config["season_id"]
-                season_label = f"{season_id}/{str(season_id + 1)[-2:]}"  # e.g., "2024/25"
-                logger.info(f"Selecting season: {season_label}")
-                
-                try:
-                    # Find and click season option
-                    season_options = self.driver.find_elements(
-                        By.XPATH, 
-                        "//label[contains(@class, 'input-button__label')]"
-                    )
-                    for opt in season_options:
-                        if season_label in opt.text.strip():
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", opt)
-                            time.sleep(0.3)
-                            self.driver.execute_script("arguments[0].click();", opt)
-                            logger.info(f"Selected season: {opt.text.strip()}")
-                            break
-                    time.sleep(0.5)
-                except Exception as e:
-                    logger.warning(f"Could not select season: {e}")
-                
-                # Clear month filter by clicking "All" option for months
-                try:
-                    month_all = self.driver.find_element(
-                        By.XPATH, "//label[contains(@class, 'input-button__label') and text()='All']"
-                    )
-                    self.driver.execute_script("arguments[0].click();", month_all)
-                    time.sleep(0.5)
-                except NoSuchElementException:
-                    pass
-                
-                # Find and click the specific matchweek option
-                mw_label_xpath = f"//label[contains(@class, 'input-button__label') and text()='MW{matchweek}']"
-                try:
-                    mw_option = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, mw_label_xpath))
-                    )
-                    self.driver.execute_script("arguments[0].click();", mw_option)
-                    time.sleep(0.5)
-                except TimeoutException:
-                    # Try scrolling to find MW option
-                    mw_options = self.driver.find_elements(
-                        By.XPATH, 
-                        "//label[contains(@class, 'input-button__label')]"
-                    )
-                    for opt in mw_options:
-                        if opt.text.strip() == f"MW{matchweek}":
-                            self.driver.execute_script("arguments[0].scrollIntoView(true);", opt)
-                            time.sleep(0.3)
-                            self.driver.execute_script("arguments[0].click();", opt)
-                            break
-                    time.sleep(0.5)
-                
-                # Click Save button
-                save_btn = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[text()='Save']"))
-                )
-                self.driver.execute_script("arguments[0].click();", save_btn)
-                time.sleep(3)  # Wait for results to update
-                
+            # Season, month, matchweek and Save are applied in one browser round trip
+            season_id = season_config["season_id"]
+            season_label = f"{season_id}/{str(season_id + 1)[-2:]}"  # e.g., "2024/25"
+            logger.info(f"Selecting season: {season_label}")
+            
+            steps = self.driver.execute_async_script(
+                _APPLY_RESULTS_FILTER_JS,
+                season_label,
+                f"MW{matchweek}",
+                CSS_SELECTORS["filter_options"],
+                _XPATH_FILTER_LABEL,
+                CSS_SELECTORS["results_ready"],
+                SELENIUM_CONFIG["tab_wait_timeout"] * 1000,
+            ) or {}
+            
+            if steps.get("save"):
+                if not steps.get("refreshed"):
+                    logger.debug("Results list was not re-rendered after applying the filter")
                 logger.info(f"Filter applied for {season} MW{matchweek}")
-                
-            except (TimeoutException, NoSuchElementException) as e:
-                logger.warning(f"Could not apply filter via All Filters: {e}")
+            else:
+                logger.warning(f"Could not apply filter via All Filters: {steps}")
             
             # Extract match info using JavaScript
-            extract_script = """
-                const extractMatches = () => {
-                    const matches = [];
-                    
-                    // Find all match cards
-                    const matchCards = document.querySelectorAll('a.match-card, a[href*="/match/"]');
-                    
-                    matchCards.forEach(card => {
-                        const href = card.getAttribute('href') || '';
-                        const matchIdMatch = href.match(/match\\/(\d+)/);
-                        
-                        if (matchIdMatch) {
-                            const matchId = parseInt(matchIdMatch[1]);
-                            
-                            // Get team names
-                            const teamSelectors = [
-                                '.mc-summary__team-name',
-                                '[class*="team-name"]',
-                                '.team-name'
-                            ];
-                            
-                            let homeTeam = null, awayTeam = null;
-                            for (const sel of teamSelectors) {
-                                const teams = card.querySelectorAll(sel);
-                                if (teams.length >= 2) {
-                                    homeTeam = teams[0].textContent.trim();
-                                    awayTeam = teams[1].textContent.trim();
-                                    break;
-                                }
-                            }
-                            
-                            // Get score
-                            const scoreEl = card.querySelector('.mc-summary__score, [class*="score"]');
-                            let homeScore = null, awayScore = null;
-                            if (scoreEl) {
-                                const scoreText = scoreEl.textContent.trim();
-                                const scoreMatch = scoreText.match(/(\\d+)\\s*[-–]\\s*(\\d+)/);
-                                if (scoreMatch) {
-                                    homeScore = parseInt(scoreMatch[1]);
-                                    awayScore = parseInt(scoreMatch[2]);
-                                }
-                            }
-                            
-                            // Get date
-                            const dateHeader = card.closest('.match-list-item')?.querySelector('.match-list-item__date');
-                            const date = dateHeader?.textContent.trim() || null;
-                            
-                            // Avoid duplicates
-                            if (!matches.some(m => m.match_id === matchId)) {
-                                matches.push({
-                                    match_id: matchId,
-                                    home_team: homeTeam,
-                                    away_team: awayTeam,
-                                    home_score: homeScore,
-                                    away_score: awayScore,
-                                    date: date
-                                });
-                            }
-                        }
-                    });
-                    
-                    return matches;
-                };
-                
-                return extractMatches();
-            """
-            
-            matches = self.driver.execute_script(extract_script)
+            # Already unique, sorted by match ID and capped at one matchweek
+            matches = self.driver.execute_script(_EXTRACT_MATCHES_JS, self.MATCHES_PER_WEEK)
             
             # Add matchweek info to each match
             for match in matches:
                 match["matchweek"] = matchweek
                 match["season"] = season
             
-            # Filter to only 10 matches max per matchweek
-            matches.sort(key=lambda x: x['match_id'])
-            if len(matches) > 10:
-                matches = matches[:10]
-            
             logger.info(f"Found {len(matches)} matches in Matchweek {matchweek}")
             return matches
             
@@ -333,6 +909,24 @@ class SeasonScraper:
             logger.error(f"Error fetching matchweek {matchweek}: {e}")
             return []
     
+    def _list_matchweeks(self, matchweeks: List[int], season: str) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        List matches for several matchweeks.
+        
+        Uses the Selenium results-page filter, or the season's match ID table
+        when listing_source is "ids" (keeping the drivers free for match pages).
+        """
+        listings = {}
+        for mw in matchweeks:
+            if SCRAPING_CONFIG["listing_source"] == "ids":
+                listings[mw] = [
+                    {"match_id": match_id, "matchweek": mw, "season": season}
+                    for match_id in self._calculate_match_ids_for_matchweek(mw, season)
+                ]
+            else:
+                listings[mw] = self.get_matchweek_matches(mw, season)
+        return listings
+    
     def scrape_match_with_matchweek(
         self, 
         match_id: int, 
@@ -341,6 +935,8 @@ class SeasonScraper:
     ) -> Optional[Dict[str, Any]]:
         """
         Scrape a single match with matchweek information.
+        Matches already in the resume file (resume_path) are skipped. Others are
+        served from the on-disk match cache when a fresh entry exists.
         
         Args:
             match_id: Match ID
@@ -348,278 +944,116 @@ class SeasonScraper:
             season: Season string
             
         Returns:
-            Match data dict with matchweek info
+            Match data dict with matchweek info, or None if skipped or failed
         """
+        if match_id in self._done_ids:
+            logger.info(f"Match {match_id} already scraped, skipping")
+            return None
+        return self._scrape_match_cached(match_id, matchweek, season)
+    
+    @cached_match
+    def _scrape_match_cached(
+        self,
+        match_id: int,
+        matchweek: int = None,
+        season: str = None
+    ) -> Optional[Dict[str, Any]]:
+        """Scrape a match with a pooled driver (cache lookups happen in the decorator)."""
+        with self._checkout_driver():
+            return self._scrape_match(match_id, matchweek, season)
+    
+    def _scrape_match(self, match_id: int, matchweek: Optional[int], season: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Navigate to and extract one match with the current thread's driver, retrying on browser errors."""
         url = f"https://www.premierleague.com/match/{match_id}"
-        logger.info(f"Scraping match {match_id}")
+        max_attempts = SCRAPING_CONFIG["retry_attempts"]
         
-        try:
-            self.driver.get(url)
-            time.sleep(3)
-            self._handle_cookie_consent()
+        for attempt in range(1, max_attempts + 1):
+            logger.info(f"Scraping match {match_id} (attempt {attempt}/{max_attempts})")
             
-            # Extract matchweek from page if not provided
-            if matchweek is None:
-                matchweek = self._extract_matchweek_from_page()
-            
-            # Extract match info and statistics
-            match_data = self._extract_all_match_data()
-            
-            if match_data:
-                match_data["match_id"] = match_id
-                match_data["url"] = url
-                match_data["matchweek"] = matchweek
-                match_data["season"] = season
-                match_data["scraped_at"] = datetime.now().isoformat()
+            try:
+                if self.match_limiter:
+                    self.match_limiter.acquire()
+                # get() returns at DOMContentLoaded (eager strategy); the SPA then renders the header
+                self.driver.get(url)
+                if self._wait_for_selector(CSS_SELECTORS["match_ready"], SELENIUM_CONFIG["page_ready_timeout"]) is None:
+                    logger.debug(f"Match {match_id}: header not rendered after {SELENIUM_CONFIG['page_ready_timeout']}s")
+                    # Let a slow page finish loading before falling back to whatever rendered
+                    self._wait_ready(SELENIUM_CONFIG["page_ready_timeout"])
+                self._handle_cookie_consent()
                 
-                logger.info(f"Successfully scraped match {match_id} (MW{matchweek})")
-                return match_data
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error scraping match {match_id}: {e}")
-            return None
-    
-    def _extract_matchweek_from_page(self) -> Optional[int]:
-        """Extract matchweek number from the match page."""
-        try:
-            script = """
-                const extractMW = () => {
-                    // Try multiple selectors for matchweek
-                    const selectors = [
-                        '.match-header__gameweek',
-                        '[class*="matchweek"]',
-                        '[class*="gameweek"]',
-                        '.mc-summary__info'
-                    ];
-                    
-                    for (const sel of selectors) {
-                        const el = document.querySelector(sel);
-                        if (el) {
-                            const text = el.textContent;
-                            const match = text.match(/(?:Matchweek|MW|Gameweek|GW)\s*(\d+)/i);
-                            if (match) {
-                                return parseInt(match[1]);
-                            }
-                        }
-                    }
-                    
-                    // Try from breadcrumb or page content
-                    const pageText = document.body.innerText;
-                    const match = pageText.match(/Matchweek\s+(\d+)/i);
-                    if (match) {
-                        return parseInt(match[1]);
-                    }
+                # Extract match info, events, statistics (and the page's matchweek)
+                match_data = self._extract_all_match_data(match_id)
+                
+                if match_data:
+                    page_matchweek = match_data.pop("matchweek", None)
+                    if matchweek is None:
+                        matchweek = page_matchweek
+                    match_data["match_id"] = match_id
+                    match_data["url"] = url
+                    match_data["matchweek"] = matchweek
+                    match_data["season"] = season
+                    match_data["scraped_at"] = datetime.now().isoformat()
+                    match_data["scrape_attempts"] = attempt
                     
-                    return null;
-                };
+                    logger.info(f"Successfully scraped match {match_id} (MW{matchweek})")
+                    return match_data
                 
-                return extractMW();
-            """
-            
-            return self.driver.execute_script(script)
-            
-        except Exception as e:
-            logger.warning(f"Could not extract matchweek: {e}")
-            return None
+                return None
+                
+            except WebDriverException as e:
+                logger.warning(f"Attempt {attempt}/{max_attempts} failed for match {match_id}: {e}")
+                if attempt == max_attempts:
+                    break
+                
+                # Chrome can wedge after a crash or OOM; rebuild it unless this was a plain timeout
+                if not isinstance(e, TimeoutException):
+                    try:
+                        self._restart_current_driver()
+                    except WebDriverException as restart_error:
+                        logger.error(f"Could not restart browser: {restart_error}")
+                        break
+                time.sleep(2 ** (attempt - 1) + random.random())
+                
+            except Exception as e:
+                logger.error(f"Error scraping match {match_id}: {e}")
+                return None
+        
+        logger.error(f"Giving up on match {match_id} after {max_attempts} attempts")
+        return None
     
-    def _extract_all_match_data(self) -> Optional[Dict[str, Any]]:
-        """Extract all match data including stats - comprehensive version."""
+    def _extract_all_match_data(self, match_id: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Extract all match data including stats - comprehensive version.
+        
+        Args:
+            match_id: Used to name the HTML snapshots, when snapshotting is enabled
+        """
         try:
-            # Wait for page to fully load (headless needs more time)
-            time.sleep(5)
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
-            
-            # STEP 0: Extract events (goals, cards) from main page BEFORE clicking any tabs
-            events = self._extract_events()
-            
-            # STEP 1: Click on Stats tab
-            self._click_stats_tab()
-            
-            # Scroll to load all sections
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1)
-            self.driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(1)
+            # STEP 1: One async call reads the main page (matchweek, events), clicks the
+            # Stats tab, waits for the stats table and extracts it
+            data = self._extract_stats_page(CSS_SELECTORS["stats_tab"])
+            if not data:
+                logger.warning("Stats extraction script returned no data")
+                return None
             
-            script = """
-                const extractAll = () => {
-                    // Extract team names and score
-                    const getMatchInfo = () => {
-                        // Try multiple selectors for teams
-                        const selectors = [
-                            '.match-header__team-name',
-                            '.team-name',
-                            '[class*="team-name"]',
-                            '.mc-summary__team-name'
-                        ];
-                        
-                        let homeTeam = null, awayTeam = null;
-                        for (const sel of selectors) {
-                            const teams = document.querySelectorAll(sel);
-                            if (teams.length >= 2) {
-                                homeTeam = teams[0].textContent.trim();
-                                awayTeam = teams[1].textContent.trim();
-                                break;
-                            }
-                        }
-                        
-                        // Get score
-                        let homeScore = null, awayScore = null;
-                        const scoreEl = document.querySelector('.match-header__score, .score, [class*="score"]');
-                        if (scoreEl) {
-                            const text = scoreEl.textContent.trim();
-                            const match = text.match(/(\\d+)\\s*[-–]\\s*(\\d+)/);
-                            if (match) {
-                                homeScore = parseInt(match[1]);
-                                awayScore = parseInt(match[2]);
-                            }
-                        }
-                        
-                        // Get date
-                        const dateEl = document.querySelector('.match-header__date, [class*="match-date"], time');
-                        const date = dateEl?.textContent.trim() || null;
-                        
-                        // Get venue
-                        const venueEl = document.querySelector('.match-header__venue, [class*="venue"]');
-                        const venue = venueEl?.textContent.trim() || null;
-                        
-                        // Get referee
-                        const refEl = document.querySelector('[class*="referee"]');
-                        const referee = refEl?.textContent.replace('Referee:', '').trim() || null;
-                        
-                        return {
-                            home_team: homeTeam,
-                            away_team: awayTeam,
-                            home_score: homeScore,
-                            away_score: awayScore,
-                            date: date,
-                            venue: venue,
-                            referee: referee
-                        };
-                    };
-                    
-                    // Extract all statistics (comprehensive)
-                    const getStats = () => {
-                        const stats = {};
-                        
-                        // Find all stat rows
-                        const rows = document.querySelectorAll('.match-stats__table-row, [class*="stats-row"], [class*="stat-row"]');
-                        
-                        rows.forEach(row => {
-                            // Get stat name
-                            const nameEl = row.querySelector('.match-stats__stat-name, [class*="stat-name"], [class*="name"]');
-                            if (!nameEl) return;
-                            
-                            const statName = nameEl.textContent.trim();
-                            if (!statName) return;
-                            
-                            // Get home value
-                            const homeEl = row.querySelector('.match-stats__table-cell--home, [class*="home"][class*="value"], td:first-child');
-                            const awayEl = row.querySelector('.match-stats__table-cell--away, [class*="away"][class*="value"], td:last-child');
-                            
-                            // Handle different value formats
-                            let homeValue = homeEl ? homeEl.textContent.trim() : null;
-                            let awayValue = awayEl ? awayEl.textContent.trim() : null;
-                            
-                            // Clean up values (remove percentage signs for parsing)
-                            const parseValue = (val) => {
-                                if (!val) return null;
-                                // Check if it contains a fraction like "5 (60%)"
-                                const match = val.match(/^([\\d.]+)/);
-                                return match ? match[1] : val;
-                            };
-                            
-                            stats[statName] = {
-                                home: homeValue,
-                                away: awayValue,
-                                home_parsed: parseValue(homeValue),
-                                away_parsed: parseValue(awayValue)
-                            };
-                        });
-                        
-                        return stats;
-                    };
-                    
-                    // Extract detailed stats by category
-                    const getDetailedStats = () => {
-                        const result = {
-                            top_stats: {},
-                            attack: {},
-                            possession: {},
-                            defence: {},
-                            physical: {},
-                            discipline: {}
-                        };
-                        
-                        const categoryMap = {
-                            'top stats': 'top_stats',
-                            'attack': 'attack',
-                            'possession': 'possession',
-                            'defence': 'defence',
-                            'defense': 'defence',
-                            'physical': 'physical',
-                            'discipline': 'discipline'
-                        };
-                        
-                        // Extract all rows
-                        const rows = document.querySelectorAll('.match-stats__table-row');
-                        rows.forEach(row => {
-                            const cells = row.querySelectorAll('.match-stats__table-cell');
-                            if (cells.length >= 3) {
-                                const home = cells[0].textContent.trim();
-                                const name = cells[1].textContent.trim();
-                                const away = cells[2].textContent.trim();
-                                
-                                if (name && !name.includes('undefined')) {
-                                    const section = row.closest('[class*="section"]');
-                                    let cat = 'top_stats';
-                                    
-                                    if (section) {
-                                        const sectionText = section.textContent.toLowerCase();
-                                        for (const [key, value] of Object.entries(categoryMap)) {
-                                            if (sectionText.startsWith(key)) {
-                                                cat = value;
-                                                break;
-                                            }
-                                        }
-                                    }
-                                    
-                                    result[cat][name] = {
-                                        home: home,
-                                        away: away
-                                    };
-                                }
-                            }
-                        });
-                        
-                        return result;
-                    };
-                    
-                    return {
-                        match_info: getMatchInfo(),
-                        statistics: getStats(),
-                        detailed_statistics: getDetailedStats()
-                    };
-                };
-                
-                return extractAll();
-            """
+            events = data["events"]
+            logger.opt(lazy=True).info(
+                "Extracted events: {} goals", lambda: len(events["home_goals"]) + len(events["away_goals"])
+            )
+            if self.snapshots is not None:
+                self._page_source(match_id, "stats")
             
-            data = self.driver.execute_script(script)
+            # STEP 3: Show Match Info tab and hand its HTML to the parser, which
+            # runs while the Lineups tab loads
+            info_html = self._show_tab("Match Info", CSS_SELECTORS["match_info_ready"])
+            match_info_parsed = self._submit_parse(parse_match_info, self._page_source(match_id, "match_info", info_html))
             
-            # Add events (already extracted from main page before clicking Stats tab)
-            if events:
-                data["events"] = events
+            # STEP 4: Show Lineups tab and extract lineups
+            # Substitutes are lazy-loaded; the tall viewport already has them in view
+            lineups_html = self._show_tab("Lineups", CSS_SELECTORS["lineups_ready"], SQUAD_LIST_SELECTOR)
+            lineups_parsed = self._submit_parse(parse_lineups, self._page_source(match_id, "lineups", lineups_html))
             
-            # STEP 3: Click Match Info tab and extract details
-            self._click_tab("Match Info")
-            time.sleep(2)  # Wait for tab content
-            match_info_extra = self._extract_match_info_tab()
+            match_info_extra = self._extract_match_info_tab(parsed=match_info_parsed)
             if match_info_extra:
                 # Merge with existing match_info
                 if "match_info" in data:
@@ -627,349 +1061,437 @@ class SeasonScraper:
                 else:
                     data["match_info_details"] = match_info_extra
             
-            # STEP 4: Click Lineups tab and extract lineups
-            self._click_tab("Lineups")
-            time.sleep(2) # Wait for tab content
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2) # Wait for lazy load
-            lineups = self._extract_lineups_tab()
+            lineups = self._extract_lineups_tab(parsed=lineups_parsed)
             if lineups:
                 data["lineups"] = lineups
             
             return data
             
+        except WebDriverException:
+            # Browser-level failures are retried by the caller
+            raise
         except Exception as e:
             logger.error(f"Error extracting match data: {e}")
             return None
     
-    def _click_stats_tab(self) -> bool:
-        """Click on the Stats tab."""
-        try:
-            stats_selectors = [
-                "//a[contains(text(), 'Stats')]",
-                "//button[contains(text(), 'Stats')]",
-                "//*[@data-tab-index='3']",
-            ]
-            
-            for selector in stats_selectors:
-                try:
-                    stats_tab = self.driver.find_element(By.XPATH, selector)
-                    self.driver.execute_script("arguments[0].click();", stats_tab)
-                    time.sleep(2)
-                    return True
-                except NoSuchElementException:
-                    continue
+    def _extract_stats_page(self, stats_tab_selector: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Run the extraction script on the current page.
+        
+        Args:
+            stats_tab_selector: Stats tab to click first, or None when the page already shows it
             
-            return False
+        Returns:
+            match_info, statistics, detailed_statistics, events and the page's matchweek
+        """
+        return self._run_page_script(
+            "extract_all",
+            stats_tab_selector,
+            SELENIUM_CONFIG["stats_wait_timeout"] * 1000,
+            EVENT_LIST_SELECTORS,
+            HT_SCORE_SELECTOR,
+            EVENT_SCORER_SELECTOR,
+            EVENT_ASSIST_SELECTOR,
+        )
+    
+    def reextract_match(self, match_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Rebuild a match from its HTML snapshots, without loading the live page.
+        
+        The Stats snapshot is loaded into a pooled driver and goes through the same
+        extraction script as a live scrape; the Match Info and Lineups snapshots go
+        through the same HTML parsers.
+        
+        Args:
+            match_id: Match ID the snapshots were saved under
             
-        except Exception as e:
-            logger.warning(f"Could not click Stats tab: {e}")
-            return False
+        Returns:
+            Match data dict, or None if the match has no Stats snapshot
+        """
+        if self.snapshots is None:
+            raise RuntimeError("HTML_SNAPSHOT_DIR is not set, there are no snapshots to re-extract")
+        
+        stats_html = self.snapshots.load(match_id, "stats")
+        if stats_html is None:
+            return None
+        
+        with self._checkout_driver():
+            self.driver.get("about:blank")
+            self.driver.execute_script(_LOAD_SNAPSHOT_JS, stats_html)
+            data = self._extract_stats_page(None)
+        if not data:
+            logger.warning(f"Stats extraction script returned no data for snapshot {match_id}")
+            return None
+        
+        info_html = self.snapshots.load(match_id, "match_info")
+        if info_html is not None:
+            data["match_info"].update(parse_match_info(info_html))
+        lineups_html = self.snapshots.load(match_id, "lineups")
+        if lineups_html is not None:
+            data["lineups"] = parse_lineups(lineups_html)
+        
+        data["match_id"] = match_id
+        return data
     
-    def _click_tab(self, tab_name: str) -> bool:
-        """Click on a specific tab (Stats, Match Info, Lineups, etc.)."""
-        try:
-            script = f"""
-                (() => {{
-                    const tabs = document.querySelectorAll('button, a, [role="tab"]');
-                    for (const tab of tabs) {{
-                        if (tab.textContent.trim() === '{tab_name}') {{
-                            tab.click();
-                            return true;
-                        }}
-                    }}
-                    return false;
-                }})()
-            """
-            result = self.driver.execute_script(script)
-            time.sleep(2)
-            return result
-        except:
-            return False
+    def reextract_snapshots(self) -> Iterator[Dict[str, Any]]:
+        """Re-extract every match in the snapshot directory, in match ID order."""
+        if self.snapshots is None:
+            raise RuntimeError("HTML_SNAPSHOT_DIR is not set, there are no snapshots to re-extract")
+        
+        for match_id in self.snapshots.match_ids():
+            data = self.reextract_match(match_id)
+            if data:
+                yield data
     
-    def _extract_match_info_tab(self) -> Dict[str, Any]:
-        """Extract match info from Match Info tab (kickoff, stadium, attendance, referee)."""
-        result = {
-            "kickoff": None,
-            "stadium": None,
-            "attendance": None,
-            "referee": None
-        }
+    def _page_source(self, match_id: Optional[int], tab: str, html: Optional[str] = None) -> str:
+        """
+        Fetch the current page_source, saving it for offline re-extraction when snapshots are enabled.
+        
+        Args:
+            match_id: Match ID the snapshot is saved under
+            tab: Tab name the snapshot is saved under
+            html: Page HTML already read from the browser (skips the page_source transfer)
+        """
+        if html is None:
+            html = self.driver.page_source
+        if self.snapshots is not None and match_id is not None:
+            self.snapshots.save(match_id, tab, html)
+        return html
+    
+    def _submit_parse(self, parser, html: str) -> Future:
+        """
+        Run an HTML parser in the parser processes, or inline when there are none.
         
+        Returns:
+            Future with the parser's result (or exception)
+        """
+        if self._parse_pool is not None:
+            return self._parse_pool.submit(parser, html)
+        future = Future()
         try:
-            # Find match-details entries
-            entries = self.driver.find_elements(By.CSS_SELECTOR, ".match-details__entry")
-            for entry in entries:
-                text = entry.text.lower()
-                value = ""
-                try:
-                    value = entry.find_element(By.TAG_NAME, "span").text.strip()
-                except:
-                    # Fallback if span not found
-                    parts = entry.text.split('\n')
-                    if len(parts) > 1:
-                        value = parts[-1].strip()
-
-                if "kick-off" in text or "kickoff" in text:
-                    result["kickoff"] = value
-                if "stadium" in text:
-                    result["stadium"] = value
-                if "attendance" in text:
-                    result["attendance"] = value
+            future.set_result(parser(html))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def _run_page_script(self, name: str, *args: Any) -> Any:
+        """Run one of _PAGE_SCRIPTS, by name when it is installed in the page, else by source."""
+        result = self.driver.execute_async_script(_CALL_PAGE_SCRIPT_JS, name, *args)
+        if isinstance(result, dict) and result.get("__missing"):
+            result = self.driver.execute_async_script(_PAGE_SCRIPTS[name], *args)
+        return result
+    
+    def _show_tab(self, tab_name: str, *ready_selectors: str) -> Optional[str]:
+        """
+        Click a tab, wait for its content and read the page HTML in one round trip.
+        
+        Args:
+            tab_name: Visible tab label
+            ready_selectors: Elements that only exist once the tab content has rendered
             
-            # Find referee from page text using regex as backup if not in entries
-            if not result["referee"]:
-                try:
-                    page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                    ref_match = re.search(r"Referee\s+([A-Za-z\s]+?)\s+(?:Assistant|Fourth|VAR|$)", page_text, re.IGNORECASE)
-                    if ref_match:
-                        result["referee"] = ref_match.group(1).strip()
-                except: pass
-                
+        Returns:
+            Page HTML, or None if the tab was not found (callers then parse page_source)
+        """
+        result = self._run_page_script(
+            "show_tab",
+            'button, a, [role="tab"]',
+            tab_name,
+            list(ready_selectors),
+            SELENIUM_CONFIG["tab_wait_timeout"] * 1000,
+        )
+        if not result or not result.get("clicked"):
+            logger.debug(f"Tab {tab_name!r} not found")
+            return None
+        if not result.get("ready"):
+            logger.debug(f"Tab {tab_name!r} content not rendered after {SELENIUM_CONFIG['tab_wait_timeout']}s")
+        return result.get("html")
+    
+    def _extract_match_info_tab(self, parsed: Optional[Future] = None) -> Dict[str, Any]:
+        """
+        Extract match info from Match Info tab (kickoff, stadium, attendance, referee).
+        
+        Args:
+            parsed: Pending parse_match_info result (defaults to parsing the current page_source)
+        """
+        try:
+            # One page_source transfer instead of a round trip per entry
+            result = parsed.result() if parsed is not None else parse_match_info(self.driver.page_source)
             logger.info(f"Extracted match info: stadium={result.get('stadium')}, referee={result.get('referee')}")
             return result
         except Exception as e:
             logger.error(f"Error extracting match info: {e}")
-            return result
+            return {"kickoff": None, "stadium": None, "attendance": None, "referee": None}
     
-    def _extract_lineups_tab(self) -> Dict[str, Any]:
-        """Extract lineups from Lineups tab (formations, managers, starting XI, subs)."""
-        result = {
-            "home": {"formation": None, "manager": None, "starting_xi": [], "substitutes": []},
-            "away": {"formation": None, "manager": None, "starting_xi": [], "substitutes": []}
-        }
+    def _extract_lineups_tab(self, parsed: Optional[Future] = None) -> Dict[str, Any]:
+        """
+        Extract lineups from Lineups tab (formations, managers, starting XI, subs).
         
+        Args:
+            parsed: Pending parse_lineups result (defaults to parsing the current page_source)
+        """
         try:
-            # Get formations from text
-            try:
-                page_text = self.driver.find_element(By.TAG_NAME, "body").text
-                formations = re.findall(r"Formation\s+(\d+-\d+-\d+)", page_text, re.IGNORECASE)
-                if len(formations) >= 2:
-                    result["home"]["formation"] = formations[0]
-                    result["away"]["formation"] = formations[1]
-                
-                managers = re.findall(r"Manager\s+([A-Za-z\s]+?)(?=\d|Formation|$)", page_text, re.IGNORECASE)
-                if len(managers) >= 2:
-                    result["home"]["manager"] = managers[0].strip()
-                    result["away"]["manager"] = managers[1].strip()
-            except: pass
-            
-            # Helper to extract players from container
-            def get_players(container_selector):
-                players = []
-                try:
-                    container = self.driver.find_elements(By.CSS_SELECTOR, container_selector)
-                    if not container: return []
-                    
-                    player_elements = container[0].find_elements(By.CSS_SELECTOR, ".lineups-player")
-                    for p in player_elements:
-                        try:
-                            # Try multiple selectors for name
-                            name = ""
-                            try:
-                                name = p.find_element(By.CSS_SELECTOR, "p.lineups-player__info").text
-                            except:
-                                try:
-                                    name = p.find_element(By.TAG_NAME, "p").text
-                                except:
-                                    try:
-                                        name = p.find_element(By.CSS_SELECTOR, ".lineups-player__name").text
-                                    except: pass
-                            
-                            # Number
-                            number = None
-                            try:
-                                number = p.find_element(By.CSS_SELECTOR, ".lineups-player__shirt-number").text
-                            except:
-                                try:
-                                    number = p.find_element(By.CSS_SELECTOR, ".lineups-player__number").text
-                                except: pass
-                                
-                            if name:
-                                players.append({"name": name.strip(), "number": number})
-                        except: continue
-                except Exception as e:
-                    logger.warning(f"Error getting players from {container_selector}: {e}")
-                return players
-
-            # Get Starting XI
-            result["home"]["starting_xi"] = get_players(".lineups-team-formation--home")
-            result["away"]["starting_xi"] = get_players(".lineups-team-formation--away")
-            
-            # Fallback if specific containers not found (sometimes structure differs)
-            if not result["home"]["starting_xi"] and not result["away"]["starting_xi"]:
-                all_players_els = self.driver.find_elements(By.CSS_SELECTOR, ".lineups-player")
-                all_players = []
-                for p in all_players_els:
-                    try:
-                        name = p.text.split('\n')[0] # Simple split fall back
-                        all_players.append({"name": name, "number": None}) 
-                    except: pass
-                
-                # Assume first 11 home, next 11 away
-                if len(all_players) >= 22:
-                    result["home"]["starting_xi"] = all_players[:11]
-                    result["away"]["starting_xi"] = all_players[11:22]
-
-            # Substitutes
-            try:
-                sub_lists = self.driver.find_elements(By.CSS_SELECTOR, ".squad-list")
-                teams = ["home", "away"]
-                for i, s_list in enumerate(sub_lists):
-                    if i >= 2: break
-                    team = teams[i]
-                    items = s_list.find_elements(By.CSS_SELECTOR, ".squad-list__item")
-                    for item in items:
-                        result[team]["substitutes"].append({"name": item.text.strip()})
-            except Exception as e:
-                logger.warning(f"Error extracting subs: {e}")
-
-            home_count = len(result["home"]["starting_xi"])
-            away_count = len(result["away"]["starting_xi"])
-            logger.info(f"Extracted lineups: Home {home_count}, Away {away_count} players")
+            # One page_source transfer instead of a round trip per player
+            result = parsed.result() if parsed is not None else parse_lineups(self.driver.page_source)
+            # Counts are only computed if an INFO sink will emit the message
+            logger.opt(lazy=True).info(
+                "Extracted lineups: Home {}, Away {} players",
+                lambda: len(result["home"]["starting_xi"]),
+                lambda: len(result["away"]["starting_xi"]),
+            )
             return result
-            
         except Exception as e:
             logger.error(f"Error extracting lineups: {e}")
-            return result
+            return empty_lineups()
     
-    def _extract_events(self) -> Dict[str, Any]:
-        """Extract goals and cards from the scoreboard on main page."""
-        result = {
-            "half_time_score": None,
-            "home_goals": [],
-            "away_goals": [],
-            "home_yellow_cards": [],
-            "away_yellow_cards": [],
-            "home_red_cards": [],
-            "away_red_cards": []
-        }
+    def _scrape_jobs(self, jobs: List[Tuple[int, int]], season: str, delay: float) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Scrape (match_id, matchweek) jobs, in parallel across the driver pool
+        or the worker processes. Results are yielded in job order on the calling thread.
+        """
+        if self._process_pool is not None:
+            # Worker scrapers don't see this scraper's resume file, so done matches
+            # are skipped here (as None, keeping results in job order)
+            results = self._process_pool.map(
+                _scrape_in_worker,
+                [(match_id, mw, season, delay) for match_id, mw in jobs if match_id not in self._done_ids]
+            )
+            for match_id, _ in jobs:
+                if match_id in self._done_ids:
+                    logger.info(f"Match {match_id} already scraped, skipping")
+                    yield None
+                else:
+                    yield next(results)
+            return
         
-        try:
-            # Half-time score
-            try:
-                ht_elem = self.driver.find_element(By.CLASS_NAME, "match-status__half-time-score")
-                text = ht_elem.text.strip()
-                import re
-                m = re.search(r"HT\s*(\d+)\s*[-–]\s*(\d+)", text, re.IGNORECASE)
-                if m:
-                    result["half_time_score"] = f"{m.group(1)}-{m.group(2)}"
-            except Exception:
-                pass # Optional element
-
-            # Helper to extract events from list
-            def extract_list_items(selector, target_list):
-                try:
-                    ul_elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if not ul_elements: return
-                    
-                    # Usually only one ul per type per team
-                    # Use the first found ul element
-                    lis = ul_elements[0].find_elements(By.TAG_NAME, "li")
-                    for li in lis:
-                        text = li.text.strip()
-                        if not text: continue
-                        
-                        # Try to parse scorer/assist if it's a goal
-                        if "Goals" in selector:
-                            scorer = text
-                            assist = None
-                            # Try to find specific parts if possible, otherwise use full text
-                            try:
-                                scorer_el = li.find_element(By.CSS_SELECTOR, ".scoreboard-event__scorer")
-                                scorer = scorer_el.text.strip()
-                                assist_el = li.find_element(By.CSS_SELECTOR, ".scoreboard-event__assist")
-                                assist = assist_el.text.strip()
-                            except NoSuchElementException:
-                                pass # Elements not found, use full text as scorer
-                            
-                            target_list.append({
-                                "scorer": scorer,
-                                "assist": assist
-                            })
-                        else:
-                            # Cards just append text
-                            target_list.append(text)
-                except Exception as e:
-                    logger.warning(f"Error extracting {selector}: {e}")
-
-            # Extract Goals
-            extract_list_items('ul[data-testid="homeTeamGoals"]', result["home_goals"])
-            extract_list_items('ul[data-testid="awayTeamGoals"]', result["away_goals"])
-            
-            # Extract Cards
-            extract_list_items('ul[data-testid="homeTeamYellowCards"]', result["home_yellow_cards"])
-            extract_list_items('ul[data-testid="awayTeamYellowCards"]', result["away_yellow_cards"])
-            extract_list_items('ul[data-testid="homeTeamRedCards"]', result["home_red_cards"])
-            extract_list_items('ul[data-testid="awayTeamRedCards"]', result["away_red_cards"])
-            
-            logger.info(f"Extracted events: {len(result['home_goals']) + len(result['away_goals'])} goals")
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error extracting events: {e}")
-            return result
+        # Same average pace as one match per `delay` seconds per driver, but
+        # time spent scraping counts towards the wait
+        self.match_limiter = RateLimiter(self.pool.size / delay, burst=self.pool.size) if delay > 0 else None
+        
+        def scrape_one(job: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+            match_id, matchweek = job
+            return self.scrape_match_with_matchweek(
+                match_id=match_id,
+                matchweek=matchweek,
+                season=season
+            )
+        
+        if self.pool.size == 1:
+            yield from map(scrape_one, jobs)
+            return
+        
+        with ThreadPoolExecutor(max_workers=self.pool.size) as executor:
+            yield from executor.map(scrape_one, jobs)
     
-    def scrape_season(
+    def scrape_matchweek_parallel(
         self,
+        matchweek: int,
         season: str = "2025/26",
-        start_matchweek: int = 1,
-        end_matchweek: int = 38,
         delay: float = 2.0
     ) -> List[Dict[str, Any]]:
         """
-        Scrape all matches for specified matchweeks in a season.
+        Scrape one matchweek across the warm driver pool, without a listing step.
+        
+        Match IDs come from the season's sequential ID range, so no results page
+        is loaded. The pool is started on first use and left running for further
+        calls; use the scraper as a context manager to shut it down.
         
         Args:
+            matchweek: Matchweek number (1-38)
             season: Season string
-            start_matchweek: Starting matchweek (1-38)
-            end_matchweek: Ending matchweek (1-38)
-            delay: Delay between requests in seconds
+            delay: Delay after each match, per driver
             
         Returns:
-            List of all match data
+            List of scraped match data, in match ID order
         """
-        all_matches = []
+        self.start()
+        jobs = [(match_id, matchweek) for match_id in self._calculate_match_ids_for_matchweek(matchweek, season)]
+        matches = [m for m in self._scrape_jobs(jobs, season, delay) if m]
+        logger.info(f"MW{matchweek}: scraped {len(matches)}/{len(jobs)} matches")
+        return matches
+    
+    @staticmethod
+    def _load_scraped_ids(output_path: str) -> Set[int]:
+        """Read match IDs already written to a JSONL output file."""
+        scraped_ids = set()
+        if not os.path.exists(output_path):
+            return scraped_ids
+        
+        with open(output_path, "rb") as f:
+            for line in f:
+                try:
+                    scraped_ids.add(_loads_line(line)["match_id"])
+                except (ValueError, KeyError, TypeError):
+                    # Partial line left behind by an interrupted run
+                    continue
+        
+        logger.info(f"Found {len(scraped_ids)} matches already scraped in {output_path}")
+        return scraped_ids
+    
+    @staticmethod
+    def _append_jsonl(out, match_data: Dict[str, Any]) -> None:
+        """Append one match as a JSON line and make sure it reaches disk."""
+        out.write(_dumps_line(match_data))
+        out.flush()
+        os.fsync(out.fileno())
+    
+    def iter_matchweeks(
+        self,
+        matchweeks: List[int],
+        season: str = "2025/26",
+        delay: float = 2.0,
+        output_path: Optional[str] = None,
+        parquet_dir: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Scrape matchweeks and yield each match as soon as it is scraped.
+        
+        Nothing is accumulated in memory, so callers can stream a whole season.
+        
+        Args:
+            matchweeks: List of matchweek numbers to scrape
+            season: Season string
+            delay: Delay between requests in seconds
+            output_path: Optional JSONL file. Each match is appended as soon as it is
+                scraped and matches already in the file are skipped, so an interrupted
+                run can be resumed.
+            parquet_dir: Optional directory for columnar output (one Parquet file
+                per matchweek and run, written in record batches; requires pyarrow)
+            
+        Yields:
+            Match data dicts
+        """
+        scraped_ids = set(self._done_ids)
+        if output_path:
+            scraped_ids |= self._load_scraped_ids(output_path)
+        out = None
+        parquet = None
         
         try:
             self.start()
+            if output_path:
+                out = open(output_path, "ab")
+                # Start on a fresh line if an interrupted run left a partial one
+                if out.tell():
+                    with open(output_path, "rb") as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            out.write(b"\n")
+            if parquet_dir:
+                from data.parquet_writer import MatchParquetWriter
+                parquet = MatchParquetWriter(parquet_dir)
             
-            for mw in range(start_matchweek, end_matchweek + 1):
-                logger.info(f"Processing Matchweek {mw}/{end_matchweek}")
-                
-                # Get match list for this matchweek
-                mw_matches = self.get_matchweek_matches(mw, season)
-                
-                for i, match_info in enumerate(mw_matches):
+            # Get match lists for all matchweeks up front
+            listings = self._list_matchweeks(matchweeks, season)
+            
+            # One job list for all matchweeks, so the driver pool never drains
+            # at a matchweek boundary
+            jobs = []
+            pending = {}
+            for mw in matchweeks:
+                logger.info(f"Processing Matchweek {mw}")
+                pending[mw] = 0
+                for match_info in listings[mw]:
                     match_id = match_info["match_id"]
-                    logger.info(f"  Match {i+1}/{len(mw_matches)}: {match_id}")
-                    
-                    # Scrape individual match
-                    match_data = self.scrape_match_with_matchweek(
-                        match_id=match_id,
-                        matchweek=mw,
-                        season=season
-                    )
-                    
-                    if match_data:
-                        all_matches.append(match_data)
-                    
-                    # Delay between matches
-                    time.sleep(delay)
-                
-                logger.info(f"Completed Matchweek {mw}: {len(mw_matches)} matches")
+                    if match_id in scraped_ids:
+                        logger.info(f"  Match {match_id} already scraped, skipping")
+                        continue
+                    jobs.append((match_id, mw))
+                    pending[mw] += 1
+                if not pending[mw]:
+                    logger.info(f"Completed Matchweek {mw}: {len(listings[mw])} matches")
+            
+            # Results arrive in job order, i.e. matchweek by matchweek
+            for (_, mw), match_data in zip(jobs, self._scrape_jobs(jobs, season, delay)):
+                pending[mw] -= 1
+                if match_data:
+                    if out:
+                        self._append_jsonl(out, match_data)
+                        scraped_ids.add(match_data["match_id"])
+                    if parquet:
+                        parquet.write(match_data)
+                    yield match_data
+                if not pending[mw]:
+                    logger.info(f"Completed Matchweek {mw}: {len(listings[mw])} matches")
             
         finally:
+            if out:
+                out.close()
+            if parquet:
+                parquet.close()
             self.stop()
+    
+    def _collect(self, matches: Iterator[Dict[str, Any]], keep: bool) -> List[Dict[str, Any]]:
+        """Drain a match stream, keeping the matches in memory only if asked to."""
+        all_matches = []
+        scraped_count = 0
+        for match_data in matches:
+            scraped_count += 1
+            if keep:
+                all_matches.append(match_data)
         
-        logger.info(f"Season scrape complete: {len(all_matches)} total matches")
+        logger.info(f"Scrape complete: {scraped_count} total matches")
         return all_matches
     
+    def iter_season(
+        self,
+        season: str = "2025/26",
+        start_matchweek: int = 1,
+        end_matchweek: int = 38,
+        delay: float = 2.0,
+        output_path: Optional[str] = None,
+        parquet_dir: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all matches for a range of matchweeks, one dict at a time.
+        
+        Args:
+            season: Season string
+            start_matchweek: Starting matchweek (1-38)
+            end_matchweek: Ending matchweek (1-38)
+            delay: Delay between requests in seconds
+            output_path: Optional JSONL file to append matches to (see iter_matchweeks)
+            parquet_dir: Optional directory for per-matchweek Parquet files
+            
+        Yields:
+            Match data dicts
+        """
+        return self.iter_matchweeks(
+            list(range(start_matchweek, end_matchweek + 1)), season, delay, output_path, parquet_dir
+        )
+    
+    def scrape_season(
+        self,
+        season: str = "2025/26",
+        start_matchweek: int = 1,
+        end_matchweek: int = 38,
+        delay: float = 2.0,
+        output_path: Optional[str] = None,
+        parquet_dir: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape all matches for specified matchweeks in a season.
+        
+        Args:
+            season: Season string
+            start_matchweek: Starting matchweek (1-38)
+            end_matchweek: Ending matchweek (1-38)
+            delay: Delay between requests in seconds
+            output_path: Optional JSONL file to stream matches to (see iter_matchweeks)
+            parquet_dir: Optional directory for per-matchweek Parquet files
+            
+        Returns:
+            List of all match data (empty when streaming to output_path)
+        """
+        matches = self.iter_season(season, start_matchweek, end_matchweek, delay, output_path, parquet_dir)
+        return self._collect(matches, keep=output_path is None)
+    
     def scrape_matchweeks(
         self,
         matchweeks: List[int],
         season: str = "2025/26",
-        delay: float = 2.0
+        delay: float = 2.0,
+        output_path: Optional[str] = None,
+        parquet_dir: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Scrape specific matchweeks.
@@ -978,38 +1500,83 @@ class SeasonScraper:
             matchweeks: List of matchweek numbers to scrape
             season: Season string
             delay: Delay between requests
+            output_path: Optional JSONL file to stream matches to (see iter_matchweeks)
+            parquet_dir: Optional directory for per-matchweek Parquet files
             
         Returns:
-            List of match data
+            List of match data (empty when streaming to output_path)
         """
-        all_matches = []
+        matches = self.iter_matchweeks(matchweeks, season, delay, output_path, parquet_dir)
+        return self._collect(matches, keep=output_path is None)
+    
+    async def ascrape_season(
+        self,
+        season: str = "2025/26",
+        start_matchweek: int = 1,
+        end_matchweek: int = 38,
+        delay: float = 2.0,
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        asyncio counterpart of scrape_season, for callers that run an event loop.
+        
+        Blocking Selenium work runs in executor threads (or the worker processes),
+        bounded by a semaphore, so the event loop stays free while browsers load
+        pages; the politeness delay is applied in those threads or processes.
+        
+        Args:
+            season: Season string
+            start_matchweek: Starting matchweek (1-38)
+            end_matchweek: Ending matchweek (1-38)
+            delay: Delay between matches in seconds, per driver
+            max_concurrency: Matches in flight at once (defaults to the driver or process count)
+            
+        Returns:
+            List of all match data, in match order
+        """
+        loop = asyncio.get_running_loop()
+        matchweeks = list(range(start_matchweek, end_matchweek + 1))
         
+        await loop.run_in_executor(None, self.start)
         try:
-            self.start()
+            # The listing drives a browser, so it is kept off the event loop
+            listings = await loop.run_in_executor(None, self._list_matchweeks, matchweeks, season)
+            jobs = [
+                (match_info["match_id"], mw)
+                for mw in matchweeks
+                for match_info in listings[mw]
+                if match_info["match_id"] not in self._done_ids
+            ]
             
-            for mw in matchweeks:
-                logger.info(f"Processing Matchweek {mw}")
-                
-                mw_matches = self.get_matchweek_matches(mw, season)
-                
-                for match_info in mw_matches:
-                    match_id = match_info["match_id"]
-                    
-                    match_data = self.scrape_match_with_matchweek(
-                        match_id=match_id,
-                        matchweek=mw,
-                        season=season
+            workers = self.processes if self._process_pool is not None else self.pool.size
+            semaphore = asyncio.Semaphore(max_concurrency or workers)
+            # Pacing happens right before navigation, in the executor threads (worker
+            # processes pace themselves), so cache hits are not delayed
+            if self._process_pool is None:
+                self.match_limiter = RateLimiter(workers / delay, burst=workers) if delay > 0 else None
+            executor = self._process_pool or ThreadPoolExecutor(max_workers=self.pool.size)
+            
+            async def scrape_one(match_id: int, matchweek: int) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    if self._process_pool is not None:
+                        return await loop.run_in_executor(
+                            executor, _scrape_in_worker, (match_id, matchweek, season, delay)
+                        )
+                    return await loop.run_in_executor(
+                        executor, self.scrape_match_with_matchweek, match_id, matchweek, season
                     )
-                    
-                    if match_data:
-                        all_matches.append(match_data)
-                    
-                    time.sleep(delay)
-                
+            
+            try:
+                results = await asyncio.gather(*(scrape_one(match_id, mw) for match_id, mw in jobs))
+            finally:
+                if executor is not self._process_pool:
+                    executor.shutdown(wait=True)
+            
+            matches = [match_data for match_data in results if match_data]
+            logger.info(f"Scrape complete: {len(matches)} total matches")
+            return matches
         finally:
-            self.stop()
-        
-        return all_matches
+            await loop.run_in_executor(None, self.stop)
     
     def __enter__(self):
         self.start()
@@ -1019,10 +1586,44 @@ class SeasonScraper:
         self.stop()
 
 
+
+# Scraper owned by a worker process (see SeasonScraper.processes)
+_worker_scraper: Optional[SeasonScraper] = None
+
+
+def _init_worker(headless: bool) -> None:
+    """ProcessPoolExecutor initializer: start one persistent driver for this process."""
+    global _worker_scraper
+    # The worker is already a process of its own, so it parses inline
+    _worker_scraper = SeasonScraper(headless=headless, pool_size=1, processes=0, parse_workers=0)
+    _worker_scraper.start()
+    # Runs when the worker exits on pool shutdown
+    Finalize(None, _worker_scraper.stop, exitpriority=10)
+
+
+def _scrape_in_worker(job: Tuple[int, int, str, float]) -> Optional[Dict[str, Any]]:
+    """Scrape one (match_id, matchweek, season, delay) job with the worker's driver."""
+    match_id, matchweek, season, delay = job
+    # Paces the worker's own driver, created on its first paced job
+    if delay > 0 and _worker_scraper.match_limiter is None:
+        _worker_scraper.match_limiter = RateLimiter(1 / delay)
+    return _worker_scraper.scrape_match_with_matchweek(
+        match_id=match_id,
+        matchweek=matchweek,
+        season=season
+    )
+
+
 # Example usage
+#   python scraper/season_scraper.py          quick summary from the matchweek listing only
+#   python scraper/season_scraper.py --deep   also navigate to the first match for full stats
 if __name__ == "__main__":
     import os
     
+    deep = "--deep" in sys.argv
+    # Rebuild every match saved under HTML_SNAPSHOT_DIR and print it as JSON lines
+    reextract = "--reextract" in sys.argv
+    
     # Configure logging
     os.makedirs("logs", exist_ok=True)
     logger.add("logs/season_scraper.log", rotation="10 MB")
@@ -1033,22 +1634,33 @@ if __name__ == "__main__":
     try:
         scraper.start()
         
+        if reextract:
+            for match_data in scraper.reextract_snapshots():
+                sys.stdout.buffer.write(_dumps_line(match_data))
+            sys.exit(0)
+        
         # Get matches from Matchweek 1
         matches = scraper.get_matchweek_matches(matchweek=1, season="2025/26")
-        print(f"\nFound {len(matches)} matches in MW1:")
+        logger.info("Found {} matches in MW1", len(matches))
         for m in matches:
-            print(f"  {m['match_id']}: {m['home_team']} vs {m['away_team']} (MW{m['matchweek']})")
+            logger.info(
+                "  {}: {} {} - {} {} (MW{})",
+                m["match_id"], m["home_team"], m.get("home_score"), m.get("away_score"), m["away_team"], m["matchweek"]
+            )
         
-        # Scrape first match with full stats
-        if matches:
+        # The listing already carries teams and scores; only load a match page for deep stats
+        if deep and matches:
             first_match = matches[0]
             full_data = scraper.scrape_match_with_matchweek(
                 match_id=first_match["match_id"],
                 matchweek=1,
                 season="2025/26"
             )
-            print(f"\nFull match data:")
-            print(json.dumps(full_data, indent=2, ensure_ascii=False))
+            # Only serialize the payload if a sink actually emits DEBUG records
+            logger.opt(lazy=True).debug(
+                "Full match data:\n{}",
+                lambda: json.dumps(full_data, indent=2, ensure_ascii=False)
+            )
             
     finally:
         scraper.stop()
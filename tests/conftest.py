@@ -0,0 +1,13 @@
+import pytest
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import CACHE_CONFIG
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep scrapers built by the tests from writing to the real match cache."""
+    monkeypatch.setitem(CACHE_CONFIG, "cache_dir", str(tmp_path / "cache"))
+    monkeypatch.setitem(CACHE_CONFIG, "html_snapshot_dir", "")
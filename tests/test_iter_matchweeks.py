@@ -0,0 +1,89 @@
+"""JSONL resume in SeasonScraper.iter_matchweeks, with the browser side stubbed out."""
+import json
+
+import pytest
+
+from scraper.season_scraper import SeasonScraper
+
+
+SEASON = "2025/26"
+LISTINGS = {
+    1: [{"match_id": 101}, {"match_id": 102}],
+    2: [{"match_id": 201}],
+}
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    def make(**kwargs):
+        scraper = SeasonScraper(processes=0, parse_workers=0, **kwargs)
+        scraper.jobs = []
+
+        def scrape_jobs(jobs, season, delay):
+            scraper.jobs.extend(jobs)
+            for match_id, mw in jobs:
+                yield {"match_id": match_id, "matchweek": mw, "season": season}
+
+        monkeypatch.setattr(scraper, "start", lambda: None)
+        monkeypatch.setattr(scraper, "stop", lambda: None)
+        monkeypatch.setattr(scraper, "_list_matchweeks", lambda matchweeks, season: LISTINGS)
+        monkeypatch.setattr(scraper, "_scrape_jobs", scrape_jobs)
+        return scraper
+
+    return make
+
+
+def _ids(path):
+    """Match IDs of the complete lines in a JSONL file."""
+    ids = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                ids.append(json.loads(line)["match_id"])
+            except ValueError:
+                continue
+    return ids
+
+
+def test_appends_each_match_to_output(scraper, tmp_path):
+    output = tmp_path / "matches.jsonl"
+    matches = list(scraper().iter_matchweeks([1, 2], SEASON, delay=0, output_path=str(output)))
+
+    assert [m["match_id"] for m in matches] == [101, 102, 201]
+    assert _ids(output) == [101, 102, 201]
+
+
+def test_resumes_from_existing_output(scraper, tmp_path):
+    output = tmp_path / "matches.jsonl"
+    # Last line left partial by an interrupted run
+    output.write_bytes(b'{"match_id": 101, "matchweek": 1}\n{"match_id": 10')
+
+    s = scraper()
+    matches = list(s.iter_matchweeks([1, 2], SEASON, delay=0, output_path=str(output)))
+
+    assert s.jobs == [(102, 1), (201, 2)]
+    assert [m["match_id"] for m in matches] == [102, 201]
+    # New matches do not get glued onto the partial line
+    assert _ids(output) == [101, 102, 201]
+
+
+def test_second_run_scrapes_nothing(scraper, tmp_path):
+    output = tmp_path / "matches.jsonl"
+    list(scraper().iter_matchweeks([1, 2], SEASON, delay=0, output_path=str(output)))
+
+    s = scraper()
+    assert list(s.iter_matchweeks([1, 2], SEASON, delay=0, output_path=str(output))) == []
+    assert s.jobs == []
+    assert _ids(output) == [101, 102, 201]
+
+
+def test_resume_path_is_read_but_not_written(scraper, tmp_path):
+    resume = tmp_path / "previous.jsonl"
+    resume.write_bytes(b'{"match_id": 201}\n')
+
+    s = scraper(resume_path=str(resume))
+    matches = list(s.iter_matchweeks([1, 2], SEASON, delay=0))
+
+    assert s.jobs == [(101, 1), (102, 1)]
+    assert [m["match_id"] for m in matches] == [101, 102]
+    assert _ids(resume) == [201]
@@ -0,0 +1,32 @@
+"""Matchweek listing from the season's match ID table (LISTING_SOURCE=ids)."""
+import pytest
+
+from config.settings import SCRAPING_CONFIG
+from scraper.season_scraper import SeasonScraper
+
+
+def test_match_ids_are_sequential_per_matchweek():
+    start = SeasonScraper.SEASONS["2025/26"]["start_match_id"]
+    assert SeasonScraper._calculate_match_ids_for_matchweek(1, "2025/26") == tuple(range(start, start + 10))
+    assert SeasonScraper._calculate_match_ids_for_matchweek(3, "2025/26")[0] == start + 20
+
+
+@pytest.mark.parametrize("matchweek, season", [(0, "2025/26"), (39, "2025/26"), (1, "1999/00")])
+def test_out_of_range_matchweek_or_unknown_season_has_no_ids(matchweek, season):
+    assert SeasonScraper._calculate_match_ids_for_matchweek(matchweek, season) == ()
+
+
+def test_ids_listing_does_not_use_the_browser(monkeypatch):
+    monkeypatch.setitem(SCRAPING_CONFIG, "listing_source", "ids")
+    scraper = SeasonScraper(processes=0, parse_workers=0)
+
+    def browser_listing(matchweek, season):
+        raise AssertionError("results page should not be loaded")
+
+    monkeypatch.setattr(scraper, "get_matchweek_matches", browser_listing)
+    listings = scraper._list_matchweeks([1, 2], "2025/26")
+
+    start = SeasonScraper.SEASONS["2025/26"]["start_match_id"]
+    assert sorted(listings) == [1, 2]
+    assert listings[2][0] == {"match_id": start + 10, "matchweek": 2, "season": "2025/26"}
+    assert [m["match_id"] for m in listings[1]] == list(range(start, start + 10))
@@ -0,0 +1,63 @@
+"""MatchCache keeps full-time matches forever and expires everything else."""
+import os
+import time
+
+import pytest
+
+from scraper.match_cache import MatchCache
+
+
+SEASON = "2025/26"
+LIVE_TTL = 60
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MatchCache(str(tmp_path), live_ttl=LIVE_TTL)
+
+
+def _payload(match_id, status=None, home_score=2, away_score=1):
+    return {
+        "match_id": match_id,
+        "match_info": {"home_score": home_score, "away_score": away_score, "status": status},
+    }
+
+
+def _age(cache, match_id, seconds):
+    """Backdate an entry's mtime, which is what the TTL is measured from."""
+    path = cache._path(cache._key(SEASON, match_id))
+    then = time.time() - seconds
+    os.utime(path, (then, then))
+
+
+@pytest.mark.parametrize("status", ["FT", "Full Time", "full-time", " FT "])
+def test_full_time_entry_never_expires(cache, status):
+    cache.set(SEASON, 1, _payload(1, status))
+    _age(cache, 1, LIVE_TTL * 100)
+    assert cache.get(SEASON, 1) == _payload(1, status)
+
+
+@pytest.mark.parametrize("status", [None, "", "HT", "67'", "Live", "15:00"])
+def test_entry_not_marked_full_time_expires(cache, status):
+    # Scores alone do not make a match finished: live matches have them too
+    cache.set(SEASON, 1, _payload(1, status))
+    _age(cache, 1, LIVE_TTL + 1)
+    assert cache.get(SEASON, 1) is None
+
+
+def test_live_entry_served_within_ttl(cache):
+    cache.set(SEASON, 1, _payload(1, "67'"))
+    _age(cache, 1, LIVE_TTL - 10)
+    assert cache.get(SEASON, 1) == _payload(1, "67'")
+
+
+def test_entries_are_keyed_by_season(cache):
+    cache.set(SEASON, 1, _payload(1, "FT"))
+    assert cache.get("2024/25", 1) is None
+
+
+def test_unreadable_entry_is_a_miss(cache):
+    cache.set(SEASON, 1, _payload(1, "FT"))
+    with open(cache._path(cache._key(SEASON, 1)), "w") as f:
+        f.write('{"match_id": 1, "match_')
+    assert cache.get(SEASON, 1) is None
@@ -0,0 +1,56 @@
+"""RateLimiter token bucket pacing."""
+import threading
+import time
+
+import pytest
+
+from scraper.rate_limiter import RateLimiter
+
+
+def test_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+
+def test_burst_is_not_delayed():
+    limiter = RateLimiter(rate=1, burst=3)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.1
+
+
+def test_acquisitions_past_the_burst_are_paced():
+    limiter = RateLimiter(rate=20)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    # The first token is free, the other four wait 1/20 s each
+    assert time.monotonic() - start >= 4 / 20 * 0.9
+
+
+def test_time_spent_between_calls_counts_towards_the_interval():
+    limiter = RateLimiter(rate=10)
+    limiter.acquire()
+    time.sleep(0.1)
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+def test_shared_across_threads():
+    limiter = RateLimiter(rate=20)
+    start = time.monotonic()
+    threads = [threading.Thread(target=limiter.acquire) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.monotonic() - start >= 3 / 20 * 0.9
+
+
+def test_context_manager_takes_a_token():
+    limiter = RateLimiter(rate=1)
+    with limiter:
+        pass
+    assert limiter._tokens < 1
@@ -0,0 +1,53 @@
+"""
+Re-extracting a match from its HTML snapshots must reproduce the live scrape.
+The parity test needs a local Chrome and is skipped otherwise.
+"""
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from scraper.html_snapshots import HtmlSnapshotStore
+from scraper.season_scraper import SeasonScraper
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "match_stats.html"
+MATCH_ID = 2561900
+
+
+@pytest.fixture
+def scraper(tmp_path):
+    scraper = SeasonScraper(headless=True, pool_size=1, processes=0, parse_workers=0)
+    scraper.cache = None
+    scraper.snapshots = HtmlSnapshotStore(str(tmp_path / "snapshots"))
+    return scraper
+
+
+@pytest.fixture
+def started_scraper(scraper):
+    try:
+        scraper.start()
+    except WebDriverException as e:
+        pytest.skip(f"Chrome is not available: {e.msg}")
+    yield scraper
+    scraper.stop()
+
+
+def test_reextract_matches_live_extraction(started_scraper):
+    scraper = started_scraper
+    with scraper._checkout_driver():
+        scraper.driver.get(FIXTURE.as_uri())
+        live = scraper._extract_all_match_data(MATCH_ID)
+    assert live is not None
+    assert scraper.snapshots.match_ids() == [MATCH_ID]
+
+    offline = scraper.reextract_match(MATCH_ID)
+
+    assert offline == {**live, "match_id": MATCH_ID}
+    assert offline["match_info"]["status"] == "FT"
+    # Stat names repeated across sections keep the last row, as in the browser
+    assert offline["statistics"]["Shots"]["home"] == "14"
+
+
+def test_reextract_without_stats_snapshot(scraper):
+    assert scraper.reextract_match(MATCH_ID) is None